@@ -3,12 +3,10 @@ from urllib.request import Request, urlopen
 import re
 from sys import argv
 from bs4 import BeautifulSoup
-from dateutil import parser
 import scrape_util
 from datetime import date
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = 'page05.html'
 sale_pattern = re.compile(
     r'\$(?P<price>[0-9\.]+)[^0-9]+'
@@ -22,7 +20,7 @@ sale_pattern = re.compile(
 def get_sale_date(line):
 
     date_string = re.sub(r'sale results', '', line, re.IGNORECASE).strip()
-    sale_date = parser.parse(date_string, fuzzy=True).date()
+    sale_date = scrape_util.parse_sale_date(date_string)
     if sale_date == date.today():
         sale_date = None
 
@@ -77,6 +75,8 @@ def write_sale(line, default_sale, writer):
 
 def main():
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
     # get URLs for all reports
     request = Request(
         base_url + report_path,
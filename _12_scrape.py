@@ -1,6 +1,5 @@
 import csv
-from urllib.request import Request, urlopen
-import urllib.error
+import requests
 import re
 from sys import argv
 from bs4 import BeautifulSoup
@@ -8,7 +7,6 @@ from dateutil import parser
 import scrape_util
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = 'market_reports.html'
 strip_char = ';,. \n\t'
 
@@ -26,14 +24,14 @@ def get_sale_date(this_report):
     return sale_date
 
 
-def get_sale_head(soup):
+def get_sale_head(document):
 
-    td = soup.find('td', attrs={'colspan':4})
+    td = document.xpath('//td[@colspan="4"]')
     if not td:
         pattern = re.compile(r'[0-9,]+ +head', flags=re.IGNORECASE)
-        text = soup.find(text=pattern)
+        text = next((text for text in document.itertext() if pattern.search(text)), None)
     else:
-        text = td.get_text()
+        text = td[0].xpath('string()')
 
     if text:
         text = text.replace('\n','').replace('\xa0','')
@@ -54,9 +52,9 @@ def get_sale_head(soup):
 def is_sale(this_row):
 
     is_sale = False
-    td = list(this_td for this_td in this_row.find_all('td') if this_td.get_text())
+    td = [td for td in this_row if td]
     if len(td) > 3:
-        if re.match(r'[0-9]', td[0].get_text().strip()):
+        if re.match(r'[0-9]', td[0].strip()):
             is_sale = True
 
     return is_sale
@@ -66,13 +64,13 @@ def is_heading(this_row):
 
     has_cattle = False
     has_number = False
-    td = list(this_td for this_td in this_row.find_all('td') if this_td.get_text())
+    td = [td for td in this_row if td]
     cattle_clue = r'(bulls?|steers?|strs?|cows?|heifers?|heiferettes?|hfrs?|calf|calves|pairs?)'
     if td:
-        if re.search(cattle_clue, td[0].get_text(), re.IGNORECASE):
+        if re.search(cattle_clue, td[0], re.IGNORECASE):
             has_cattle = True
         for this_td in td:
-            if re.search(r'[0-9]', this_td.get_text()):
+            if re.search(r'[0-9]', this_td):
                 has_number = True
                 break
 
@@ -141,11 +139,9 @@ def write_sale(line, default_sale, writer):
 
     for this_line in line:
         if is_heading(this_line):
-            cattle = this_line.find_all('td')[0].get_text()
-            cattle = re.sub(r'\s+', ' ', cattle).strip(strip_char)
+            cattle = this_line[0].strip(strip_char)
         elif is_sale(this_line):
-            text = this_line.get_text()
-            word = text.split()
+            word = ' '.join(this_line).split()
             sale = default_sale.copy()
             sale.update(get_sale(word, cattle))
             if sale != default_sale:
@@ -154,13 +150,12 @@ def write_sale(line, default_sale, writer):
 
 def main():
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
     # get URLs for all reports
-    request = Request(
-        base_url + report_path,
-        headers = scrape_util.url_header,
-        )
-    with urlopen(request) as io:
-        soup = BeautifulSoup(io.read(), 'lxml')
+    response = scrape_util.http_get(base_url + report_path)
+    response.raise_for_status()
+    soup = BeautifulSoup(response.content, 'lxml')
     table = next(
         this_table for this_table in soup.find_all('table')
         if not this_table.tr.table and 'ARCHIVED MARKET REPORTS' in this_table.tr.get_text()
@@ -191,13 +186,10 @@ def main():
                 url = href
             else:
                 url = base_url + this_report['href']
-            request = Request(
-                url,
-                headers=scrape_util.url_header,
-                )
-            with urlopen(request) as io:
-                soup = BeautifulSoup(io.read(), 'lxml')
-        except urllib.error.HTTPError:
+            response = scrape_util.http_get(url)
+            response.raise_for_status()
+            document = scrape_util.html_document(response.content)
+        except requests.HTTPError:
             print('HTTP error: {}'.format(url))
             continue
 
@@ -208,9 +200,9 @@ def main():
             'sale_day': sale_date.day,
             })
 
-        line = soup.find_all('tr')
+        line = list(scrape_util.html_table_rows(document, None, cell=('td', 'th')))
         if line:
-            this_default_sale['sale_head'] = get_sale_head(soup)
+            this_default_sale['sale_head'] = get_sale_head(document)
 
         # open csv file and write header
         with io_name.open('w', encoding='utf-8') as io:
@@ -3,14 +3,12 @@ from urllib.request import Request, urlopen
 import urllib.error
 import dateutil.parser
 import re
-from os import system
 from sys import argv
 from bs4 import BeautifulSoup
 import scrape_util
+import scrape_layout
  
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
-temp_raw = scrape_util.ReportRaw(argv, prefix)
 #report_path = ['/market-reports.html', '/2013-market-reports-2.html', '/2013-market-reports.html', '/2012-reports.html', '/2011-reports.html']
 report_path = ['/market-reports.html', '/2013-market-reports-2.html', '/2013-market-reports.html', '/2012-reports.html']
 strip_char = ';,. \n\t'
@@ -132,8 +130,28 @@ def write_sale(line, this_default_sale, writer):
                 writer.writerow(sale)
 
 
+def get_page_line(word):
+    """Return the lines of one report page, the left column of sales
+    before the right, splitting the page at the column boundary nearest
+    its middle.
+    """
+
+    if not word:
+        return []
+    middle = (min(this_word.x_min for this_word in word) + max(this_word.x_max for this_word in word)) / 2
+    column = scrape_layout.columns(word)
+    if column:
+        column = [min(column, key=lambda x: abs(x - middle))]
+    row = scrape_layout.table(word, column=column)
+
+    return [this_row[0] for this_row in row] + [this_row[-1] for this_row in row if len(this_row) > 1]
+
+
 def main():            
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+    temp_raw = scrape_util.ReportRaw(argv, prefix)
+
     for this_report_path in report_path:
 
         # Collect individual reports into a list
@@ -178,30 +196,12 @@ def main():
                 continue
             with temp_raw.open('wb') as io:
                 io.write(response)
-            system(scrape_util.pdftotext.format(str(temp_raw)))
 
-             # read sale text into line list
-            temp_txt = temp_raw.with_suffix('.txt')
-            if scrape_util.platform=='win32':
-                read_errors = 'ignore'
-            else:
-                read_errors = None
-            with temp_txt.open('r', errors=read_errors) as io:
-                original_line = list(this_line.strip() for this_line in io)
+            # Read each page by word position, left column then right
+            line = []
+            for word in temp_raw.pdf_to_words():
+                line += get_page_line(word)
             temp_raw.clean()
-            split_index = 110
-
-            # Look for line with two sales and the index to split the line into two columns
-            for this_line in original_line:
-                match = re.search(r'(\.{2,} *[0-9,]+).+?( {3,}).+?(\.{2,} *[0-9,]+)', this_line)
-                if match:
-                    split_index = this_line.find(match.group(2)) + len(match.group(2))
-                    break
-
-            column1 = list(this_line[0:split_index].strip() for this_line in original_line)
-            column2 = list(this_line[split_index:].strip() for this_line in original_line)
-
-            line = column1 + column2
 
             # Open a new CSV file and write each sale
             with io_name.open('w', encoding='utf-8') as io:
@@ -8,7 +8,6 @@ from bs4 import BeautifulSoup
 import scrape_util
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = 'Markets.html'
 strip_char = ';,. \n\t'
 
@@ -136,6 +135,8 @@ def get_sale_date(this_report):
 
 def main():            
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
     # Collect individual reports into a list
     request = Request(
         base_url + report_path,
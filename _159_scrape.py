@@ -1,12 +1,10 @@
 import csv
 from urllib.request import Request, urlopen
-import dateutil.parser
 import re
 from sys import argv
 from bs4 import BeautifulSoup
 import scrape_util
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = '/marketsamples.php'
 strip_char = ';,. \n\t'
 
@@ -16,9 +14,9 @@ def get_sale_date(line):
 
     match = re.search(r'(.+?)receipts.*', line, re.IGNORECASE)
     if match:
-        sale_date = dateutil.parser.parse(match.group(1).strip(' -'), fuzzy=True).date()
+        sale_date = scrape_util.parse_sale_date(match.group(1).strip(' -'), future=True)
     else:
-        sale_date = dateutil.parser.parse(line, fuzzy=True).date()
+        sale_date = scrape_util.parse_sale_date(line, future=True)
         
     return sale_date
 
@@ -69,6 +67,8 @@ def write_sale(row, cattle, this_default_sale, writer):
 
 def main():
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
     archive = scrape_util.ArchiveFolder(argv, prefix)
 
     request = Request(
@@ -1,17 +1,12 @@
 import csv
-from urllib.request import Request, urlopen
 import re
 from datetime import date
-import dateutil.parser
 from sys import argv
-from bs4 import BeautifulSoup
 from dateutil.relativedelta import relativedelta
-from os import system
+import subprocess
 import scrape_util
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
-temp_raw = scrape_util.ReportRaw(argv, prefix)
 report_path = 'index.php?option=com_content&view=article&id=251&Itemid=575'
 strip_char = ';,. \n\t'
 
@@ -19,7 +14,10 @@ strip_char = ';,. \n\t'
 def get_sale_date(date_string):
     """Return the date of the sale."""
 
-    sale_date = dateutil.parser.parse(date_string, fuzzy = True)
+    try:
+        sale_date = scrape_util.parse_sale_date(date_string, future=True)
+    except (ValueError, OverflowError):
+        sale_date = None
 
     return sale_date
 
@@ -90,9 +88,12 @@ def get_sale_location(word):
 
     sale_location = ' '.join(word)
     sale_location = re.sub(r'\(.*?\)$', '', sale_location)
-    match = re.search(r'(.*?),?(' + scrape_util.state + r')$', sale_location, re.IGNORECASE)
+    match = scrape_util.split_state(sale_location, ignore_case=True)
     if match:
-        sale_location = [match.group(1), match.group(2)]
+        city, state = match
+        if city.endswith(','):
+            city = city[:-1]
+        sale_location = [city, state]
     else:
         sale_location = [sale_location]
 
@@ -210,46 +211,53 @@ def write_sale(line, this_default_sale, writer):
 
 def main():
 
-    request = Request(
-        base_url + report_path,
-        headers = scrape_util.url_header,
-        )
-
-    with urlopen(request) as io:
-        soup = BeautifulSoup(io.read(), 'lxml')
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+    temp_raw = scrape_util.ReportRaw(argv, prefix)
 
-    report = soup.find('div', attrs={'class': 'module'}).find_all('a')
+    listing = scrape_util.ListingCache(argv, prefix)
+    report = scrape_util.fetch_links(base_url + report_path, 'div.module', listing=listing)
+    if report is None:
+        return
 
     # Locate existing CSV files
     archive = scrape_util.ArchiveFolder(argv, prefix)
 
-    for this_report in report:
+    is_complete = True
+    for text, href in report:
+
+        # Stop iteration if this report is already archived
+        pdf_url = href.replace(' ', '%20')
+        if archive.is_archived(url=pdf_url):
+            break
 
         # create temporary text file from downloaded pdf
-        request = Request(
-            this_report['href'].replace(' ', '%20'),
-            headers = scrape_util.url_header,
-            )
-        with urlopen(request) as io:
-            response = io.read()
-        with temp_raw.open('wb') as io:
-            io.write(response)
-        exit_value = system(scrape_util.pdftotext.format(str(temp_raw)))
-        if exit_value != 0:
-            print('Failure convert PDF in {}.'.format(prefix))
-            continue
+        temp_raw.fetch(pdf_url)
 
-        # read sale text into line list
-        temp_txt = temp_raw.with_suffix('.txt')
-        with temp_txt.open('r', errors = 'ignore') as io:
-            line = list(this_line.strip('\n') for this_line in io if this_line.strip())
-        temp_raw.clean()
+        # read the first page, which holds the sale date, and the remaining
+        # pages only for a new report, cleaning up however the report ends
+        page = temp_raw.pdf_pages(errors='ignore')
+        try:
+            line = list(this_line for this_line in next(page) if this_line.strip())
 
-        sale_date = get_sale_date(line[0])
+            sale_date = get_sale_date(line[0])
+            archive.record(pdf_url, temp_raw.digest(), sale_date)
+            if not sale_date:
+                is_complete = False
+                continue
 
-        io_name = archive.new_csv(sale_date)
-        if not io_name:
-            break
+            # Stop before converting the remaining pages if already archived
+            io_name = archive.new_csv(sale_date)
+            if not io_name:
+                break
+
+            line += list(this_line for this_page in page for this_line in this_page if this_line.strip())
+        except (subprocess.CalledProcessError, StopIteration):
+            print('Failure convert PDF in {}.'.format(prefix))
+            is_complete = False
+            continue
+        finally:
+            page.close()
+            temp_raw.clean()
 
         this_default_sale = default_sale.copy()
         this_default_sale.update({
@@ -263,6 +271,9 @@ def main():
                 writer.writeheader()
                 write_sale(line, this_default_sale, writer)
 
+    if is_complete:
+        listing.save()
+
 
 if __name__ == '__main__':
     main()
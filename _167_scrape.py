@@ -9,10 +9,6 @@ from bs4 import BeautifulSoup
 import scrape_util
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
-temp_raw = scrape_util.ReportRaw(argv, prefix)
-
-
 def get_sale_date(report):
     """Return the date of the livestock sale."""
 
@@ -107,6 +103,9 @@ def get_sale_location(location):
 
 def main():
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+    temp_raw = scrape_util.ReportRaw(argv, prefix)
+
     # locate existing CSV files
     archive = scrape_util.ArchiveFolder(argv, prefix)
 
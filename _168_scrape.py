@@ -1,17 +1,12 @@
 import csv
 from pathlib import Path
 from urllib.request import Request, urlopen
-import dateutil.parser
 import re
 from sys import argv
 from bs4 import BeautifulSoup
 import scrape_util
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
-blog_url = base_url + 'site/?cat=1'
-
-
 class Report(object):
 
     def __init__(self, link):
@@ -53,9 +48,9 @@ def get_sale_date(date_string):
     date_list = date_string.split()
     clean_date_string = ' '.join(date_list[1:])
     try:
-        sale_date = dateutil.parser.parse(clean_date_string).date()
+        sale_date = scrape_util.parse_sale_date(clean_date_string, fuzzy=False)
     except ValueError:
-        sale_date = dateutil.parser.parse(date_string, fuzzy=True).date()
+        sale_date = scrape_util.parse_sale_date(date_string)
     return sale_date
 
 
@@ -176,6 +171,9 @@ def write_sale(line, this_default_sale, writer):
 
 def main():            
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+    blog_url = base_url + 'site/?cat=1'
+
     # Locate existing CSV files
     archive = scrape_util.ArchiveFolder(argv, prefix)
 
@@ -1,13 +1,11 @@
 import csv
 from urllib.request import Request, urlopen
-import dateutil.parser
 import re
 from sys import argv
 from bs4 import BeautifulSoup
 import scrape_util
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = '/page2.html'
 strip_char = ';,. \n\t'
 
@@ -19,7 +17,7 @@ def get_sale_date(this_report):
     report_date = report_date.p.get_text()
     report_date = report_date.split('-')
     date_string = str(report_date[0])
-    sale_date = dateutil.parser.parse(date_string, fuzzy = True)
+    sale_date = scrape_util.parse_sale_date(date_string)
     return sale_date
 
 
@@ -79,6 +77,8 @@ def write_sale(line, this_default_sale, writer):
 
 def main():            
     
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
     # Get URLs for all reports
     request = Request(
         base_url + report_path,
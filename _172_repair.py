@@ -12,28 +12,27 @@ def get_sale_date(line):
         if match:
             line[:idx + 1] = []
             break
-    sale_date = dateutil.parser.parse(match.group(0)).date()
+    sale_date = scrape_util.parse_sale_date(match.group(0), fuzzy=False, future=True)
 
     return sale_date
 
 
 def main():
     
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
     # get raw
     report = Path(prefix + '_scrape/pdf').glob('*.pdf')
 
     # locate storage
     archive = scrape_util.ArchiveFolder(argv, prefix)
+    text = scrape_util.TextCache(argv, prefix)
     
     # write csv file for each historical report
     for this_report in report:
 
         # read raw
-        system(scrape_util.pdftotext.format(str(this_report)))
-        temp_txt = this_report.with_suffix('.txt')
-        with temp_txt.open('r') as io:
-            line = [this_line.strip() for this_line in io.readlines()]
-        temp_txt.unlink()
+        line = [this_line.strip() for this_line in text.pdf_to_lines(this_report, digest=scrape_util.archive_digest(this_report))]
 
         sale_date = get_sale_date(line)
         io_name = Path(prefix + '_scrape/' + prefix + '_' + sale_date.strftime('%y-%m-%d') + '.csv')
@@ -3,15 +3,11 @@ from urllib.request import Request, urlopen
 import re
 from sys import argv, platform
 from bs4 import BeautifulSoup
-import dateutil.parser
-from os import system
 import scrape_util
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = '/MarketReport.html'
 strip_char = ';,. \n\t@'
-temp_raw = scrape_util.ReportRaw(argv, prefix)
 head_pattern = re.compile(r'(\d+)\s*head?', re.IGNORECASE)
 sale_patterns = [
     re.compile(
@@ -27,17 +23,14 @@ sale_patterns = [
         r'[\s\$]+(?P<price>[0-9]+\.[0-9]{2}$)'
         ),
     ]
-location_pattern = re.compile(
-    r'(^|\s{2,})(?P<city>[\w\s]+),\s*'
-    r'(?P<state>' + scrape_util.state + r')$'
-    )
+city_pattern = re.compile(r'(^|\s{2,})(?P<city>[\w\s]+),\s*$')
 
 
 def get_sale_date(this_report):
 
     date_string = this_report.get_text()
     date_string = date_string.split()[0]
-    sale_date = dateutil.parser.parse(date_string, fuzzy = True)
+    sale_date = scrape_util.parse_sale_date(date_string)
         
     return sale_date
 
@@ -52,13 +45,21 @@ def get_sale_head(line):
     return match.group(1)
 
 
-def get_sale_location(match):
-    """Convert address strings into a list of address components."""
+def get_sale_location(this_line):
+    """Convert an address line into a dictionary of address components,
+    or an empty dictionary if the line does not end in a city and state.
+    """
 
-    sale = {
-        'consignor_city': match.group('city').strip(),
-        'consignor_state': match.group('state'),
-        }
+    sale = {}
+    location = scrape_util.split_state(this_line)
+    if location:
+        city, state = location
+        match = city_pattern.search(city)
+        if match:
+            sale = {
+                'consignor_city': match.group('city').strip(),
+                'consignor_state': state,
+                }
     
     return sale
 
@@ -90,14 +91,17 @@ def write_sale(line, this_default_sale, writer):
             sale = this_default_sale.copy()
             sale.update(get_sale(sale_match))
         else:
-            location_match = location_pattern.search(this_line)
-            if location_match:
-                sale.update(get_sale_location(location_match))
+            sale_location = get_sale_location(this_line)
+            if sale_location:
+                sale.update(sale_location)
                 writer.writerow(sale)
 
 
 def main():
     
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+    temp_raw = scrape_util.ReportRaw(argv, prefix)
+
     # get URLs for all reports
     request = Request(
         base_url + report_path,
@@ -129,12 +133,9 @@ def main():
             response = io.read()       
         with temp_raw.open('wb') as io:
             io.write(response)
-        system(scrape_util.pdftotext.format(str(temp_raw)))
 
         # read sale text into line list
-        temp_txt = temp_raw.with_suffix('.txt')
-        with temp_txt.open('r') as io:
-            line = [this_line.strip() for this_line in io.readlines()]
+        line = [this_line.strip() for this_line in temp_raw.pdf_to_lines()]
         temp_raw.clean()
         
         sale_head = get_sale_head(line)
@@ -1,24 +1,20 @@
 import csv
-import requests
 import re
 from sys import argv
 from bs4 import BeautifulSoup
-import dateutil.parser
 from os import system
 from pathlib import  PurePosixPath
 import scrape_util
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path_1 = 'sale_results.asp'
 report_path_2 = 'sale%20results/'
 strip_char = ';,. \n\t'
-temp_raw = scrape_util.ReportRaw(argv, prefix)
     
 
 def get_sale_date(this_report):
     match = re.search(r'(.+?)([0-9]+)_([0-9]+)', this_report)
     date_string = ' '.join([match.group(i) for i in range(1, 4)])
-    sale_date = dateutil.parser.parse(date_string, fuzzy=True)
+    sale_date = scrape_util.parse_sale_date(date_string)
     return sale_date
 
 
@@ -155,11 +151,11 @@ def write_sale(line, this_default_sale, writer):
 
 def main():
     
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+    temp_raw = scrape_util.ReportRaw(argv, prefix)
+
     # get URLs for all reports
-    response = requests.get(
-        base_url + report_path_1,
-        headers = scrape_util.url_header,
-        )
+    response = scrape_util.http_get(base_url + report_path_1)
     soup = BeautifulSoup(response.content, 'lxml')
     content = soup.find_all('table')
     report = content[1].find_all('a')
@@ -188,10 +184,7 @@ def main():
         
         # create temporary text file from downloaded pdf
         this_report = this_report_stem + '.pdf'
-        response = requests.get(
-            base_url + report_path_2 + this_report,
-            headers = scrape_util.url_header,
-            )
+        response = scrape_util.http_get(base_url + report_path_2 + this_report)
         with temp_raw.open('wb') as io:
             io.write(response.content)
         system(scrape_util.pdftotext.format(str(temp_raw)))
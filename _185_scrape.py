@@ -3,14 +3,11 @@ from urllib.request import Request, urlopen
 import re
 from sys import argv
 from bs4 import BeautifulSoup
-import dateutil.parser
 from os import system
 import scrape_util
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = 'market_reports'
-temp_raw = scrape_util.ReportRaw(argv, prefix)
 strip_char = ';,. \n\t'
 to_float = re.compile(r'\$|,')
     
@@ -25,7 +22,7 @@ def get_sale_date(line):
             match = re.search(r'page', date_string, re.IGNORECASE)
             if match:
                 date_string = date_string[:match.start()]
-            sale_date = dateutil.parser.parse(date_string, fuzzy = True)
+            sale_date = scrape_util.parse_sale_date(date_string)
             break
         
     return sale_date
@@ -126,6 +123,9 @@ def write_sale(line, this_default_sale, writer):
 
 def main():
     
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+    temp_raw = scrape_util.ReportRaw(argv, prefix)
+
     # get URLs for all reports
     request = Request(
         base_url + report_path,
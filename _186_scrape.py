@@ -1,5 +1,4 @@
 import csv
-import requests
 import dateutil.parser
 import re
 from sys import argv
@@ -7,7 +6,6 @@ from bs4 import BeautifulSoup
 import scrape_util
 
  
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = '/category/market-information/'
 strip_char = ':;,. \n\t'
 
@@ -30,7 +28,7 @@ def get_sale_date(line):
     """Return the date of the sale."""
     
     date_string = line[0].get_text().replace('\n', ' ')
-    sale_date = dateutil.parser.parse(date_string, fuzzy=True)
+    sale_date = scrape_util.parse_sale_date(date_string)
 
     return sale_date
 
@@ -86,28 +84,12 @@ def get_sale_location(word):
     return sale_location
 
 
-def is_number(string):
-    """Test whether a string is number-ish. Ignoring units like 'cwt' and 'hd'."""
-
-    if string:
-        string = re.sub(r'\$|[,-/]|cwt|he?a?d?', '', string, flags = re.IGNORECASE)
-        try:
-            float(string)
-            result = True
-        except ValueError:
-            result = False
-    else:
-        result = False
-
-    return result
-
-
 def get_sale(word, cattle):
     """Convert the input into a dictionary, with keys matching
     the CSV column headers in the scrape_util module.
     """
     
-    number_word = [idx for idx, val in enumerate(word) if is_number(val)]
+    number_word = [idx for idx, val in enumerate(word) if scrape_util.is_number_token(val)]
     
     sale_location = get_sale_location(word[:number_word[0]])
     sale = {
@@ -166,11 +148,10 @@ def write_sale(line, this_default_sale, writer):
 
 def main():            
     
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
     # Collect individual reports into a list
-    response = requests.get(
-        base_url + report_path,
-        headers=scrape_util.url_header,
-        )
+    response = scrape_util.http_get(base_url + report_path)
     soup = BeautifulSoup(response.content, 'lxml')
     report = [soup]
 
@@ -7,7 +7,6 @@ from bs4 import BeautifulSoup
 import scrape_util
  
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = '/market%20report.html'
 strip_char = ';,. \n\t'
 
@@ -36,28 +35,13 @@ def is_sale(this_line):
     return bool(has_price and is_not_succinct)
 
 
-def is_number(string):
-    """Test whether a string is number-ish. Ignoring units like 'cwt' and 'hd'."""
-
-    if string:
-        string = re.sub(r'\$|[,-/]|cwt|he?a?d?', '', string, flags = re.IGNORECASE)
-        try:
-            float(string)
-            result = True
-        except ValueError:
-            result = False
-    else:
-        result = False
-
-    return result
-
-
 def get_sale(word):
     """Convert the input into a dictionary, with keys matching
     the CSV column headers in the scrape_util module.
     """
     
-    number_word = [idx for idx, val in enumerate(word) if is_number(val)]
+    token = scrape_util.number_tokens(word)
+    number_word = [idx for idx, this_token in enumerate(token) if this_token[0]]
 
     cattle_string = word[number_word[0]+1]
 
@@ -85,31 +69,10 @@ def get_sale(word):
 
     sale['cattle_cattle'] = re.sub(r'[\r\n\t]', '', cattle_string).strip(strip_char)
 
-    price_string = word[number_word.pop()]
-
-    head_string = word[number_word.pop(0)].strip(strip_char).replace(',', '')
-    try:
-        int(head_string)
-        sale['cattle_head'] = head_string
-    except ValueError:
-        pass
+    # Head count, weight and price, with the price per cwt when the line
+    # has a weight
+    sale.update((key, value) for key, value in token if key)
 
-    # Price key depends on the existence of weight string
-    if number_word:
-        weight_string = word[number_word.pop()].strip(strip_char).replace(',', '')
-        try:
-            float(weight_string)
-            sale['cattle_avg_weight'] = weight_string
-        except ValueError:
-            pass
-        key = 'cattle_price_cwt'
-    else:
-        key = 'cattle_price'
-
-    match = re.search(r'([0-9,.]+)', price_string, re.IGNORECASE)
-    if match:
-        sale[key] = match.group(1).replace(',', '').strip(strip_char)
-        
     sale = {k:v for k,v in sale.items() if v}
     
     return sale
@@ -135,6 +98,8 @@ def write_sale(line, this_default_sale, writer):
 
 def main():            
     
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
     # Collect individual reports into a list
     request = Request(
         base_url + report_path,
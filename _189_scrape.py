@@ -3,21 +3,14 @@ from itertools import groupby
 from sys import argv
 import sys
 from os import system
-from time import sleep
 import dateutil.parser
 import re
 from urllib.request import urlretrieve
-from selenium import webdriver
-#from selenium.webdriver.common.desired_capabilities import DesiredCapabilities
 import scrape_util
+import scrape_layout
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = '/#!marketreport/cjg9'
-PIXEL_GAP = 20
-#DCAP = dict(DesiredCapabilities.PHANTOMJS)
-#DCAP['phantomjs.page.settings.userAgent'] = scrape_util.url_header['user-agent']
-temp_raw = scrape_util.ReportRaw(argv, prefix, suffix='jpg')
 
 
 def get_sale_date(line):
@@ -96,14 +89,14 @@ def write_sale_from_img(line, default_sale, writer):
 
 def main():
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+    temp_raw = scrape_util.ReportRaw(argv, prefix, suffix='jpg')
+
     # Locate existing CSV files
     archive = scrape_util.ArchiveFolder(argv, prefix)
 
-    # Use fancy webkit tools to execute javascript
-    # phantom = webdriver.PhantomJS(desired_capabilities=DCAP)
-    phantom = webdriver.PhantomJS()
-    phantom.get(base_url + report_path)
-    sleep(1)
+    # Use fancy webkit tools to execute javascript, waiting for the report
+    phantom = scrape_util.browser_get(base_url + report_path, '#cjg9 img, .s4')
 
     img = phantom.find_element_by_id('cjg9').find_element_by_tag_name('img')
     if img:
@@ -125,8 +118,6 @@ def main():
         # get to line, with a date line on top
     else:
         from_img = False
-        div = phantom.find_elements_by_class_name('s4')
-
         # Tabulate text by pixel position
         # text = []
         # for this_div in div:
@@ -135,20 +126,8 @@ def main():
         #     value = this_div.text.strip()
         #     if value:
         #         text.append([top, left, this_div.text.strip()])
-        text = [
-            [element.location['y'], element.location['x'], element.text]
-            for this_div in div for element in this_div.find_elements_by_xpath('*')
-            ]
-        text.sort(key = lambda x: x[:2])
-        position_y = 0
-        this_y = text[0][0]
-        for this_text in text:
-            last_y = this_y
-            this_y = this_text[0]
-            if (this_y - last_y) > PIXEL_GAP:
-                position_y += 1
-            this_text[0] = position_y
-        line = [[k1 for k1, g1 in groupby(g0, key=lambda x: x[-1])] for k0, g0 in groupby(text, key=lambda x: x[0])]
+        text = scrape_util.browser_text('.s4 > *')
+        line = [[k for k, g in groupby(this_line)] for this_line in scrape_layout.segments(text)]
 
         # position = 0
         # this_y = text[0][0]
@@ -1,7 +1,6 @@
 import csv
 from urllib.request import Request, urlopen
 import urllib.error
-import dateutil.parser
 from datetime import date
 import re
 from sys import argv
@@ -9,7 +8,6 @@ from bs4 import BeautifulSoup
 import scrape_util
  
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = '/category/market-reports/'
 strip_char = ';,. \n\t'
 dash = b'\xe2\x80\x93'.decode()
@@ -20,7 +18,7 @@ def get_sale_date(header):
     """Return the date of the sale."""
 
     date_string = re.split(b'\xe2\x80\x93'.decode(), header)[-1]
-    sale_date = dateutil.parser.parse(date_string, fuzzy = True).date()
+    sale_date = scrape_util.parse_sale_date(date_string, future=True)
     if sale_date == date.today():
         sale_date = None
 
@@ -157,6 +155,8 @@ def write_sale(line, this_default_sale, writer):
 
 def main():            
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
     page_num = start_page_num
     while page_num:
 
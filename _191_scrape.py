@@ -7,9 +7,7 @@ from bs4 import BeautifulSoup
 from os import system
 import scrape_util
  
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = ['/ArchivedMarketReports.html', '/Past-Year-Archived-Market-Reports.html']
-temp_raw = scrape_util.ReportRaw(argv, prefix)
 strip_char = ';,.* \n\t'
 
 
@@ -131,6 +129,9 @@ def write_sale(line, this_default_sale, writer):
 
 def main():            
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+    temp_raw = scrape_util.ReportRaw(argv, prefix)
+
     for this_report_path in report_path:
 
         # Collect individual reports into a list
@@ -7,7 +7,6 @@ from dateutil import parser
 import scrape_util
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path_1 = 'marketreport.php'
 report_path_2 = 'market-reports.php?reportID='
 strip_char = ';,. \n\t'
@@ -38,17 +37,6 @@ def get_sale_head(line):
                     return match2.group(1)
 
 
-def is_number(string):
-    """Test whether a string is numeric. Ignoring units like 'cwt' and 'hd'."""
-
-    string = re.sub(r'\$|[,-/]|cwt|he?a?d?', '', string, flags = re.IGNORECASE)
-    try:
-        float(string)
-        return True
-    except ValueError:
-        return False
-
-
 def get_sale_location(word):
     """Convert address strings into a list of address components."""
 
@@ -67,7 +55,7 @@ def get_sale_location(word):
 
 def get_sale(word):
 
-    number_word = list(idx for idx in range(len(word)) if is_number(word[idx]))
+    number_word = list(idx for idx in range(len(word)) if scrape_util.is_number_token(word[idx]))
     sale = {
         'cattle_cattle': word[number_word[0]+1].strip(strip_char)
         }
@@ -133,6 +121,8 @@ def get_sale(word):
 
 def main():
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
     # get URLs for historical reports
     request = Request(
         base_url + report_path_1,
@@ -9,10 +9,8 @@ import scrape_util
 from os import system
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 doc_query = 'index.cfm?show=82&mid=34&viewDoc={}'
-temp_raw = scrape_util.ReportRaw(argv, prefix)
-sale_pattern = [
+sale_pattern = scrape_util.PatternSet([
     re.compile(
         r'(?P<name>.*?)'
         r'(?P<location>\s{2,}(\w+\s)*\w+,.*?(\s{2,}|\s(?=[0-9])))'
@@ -49,7 +47,7 @@ sale_pattern = [
         r'(?P<cattle>[^\$]*\p{L}[^\$]*)'
         r'(?P<price>\$[0-9,\.]+)',
         ),
-    ]
+    ], engine=re)
 
 
 def get_sale_date(report):
@@ -67,7 +65,7 @@ def get_sale_date(report):
     return sale_date
 
 
-def get_sale_document(report):
+def get_sale_document(report, base_url, temp_raw):
 
     if isinstance(report, list):
         url = doc_query.format(report[0])
@@ -140,39 +138,34 @@ def get_sale_location(location):
 
 def get_sale(line, heading):
 
-    match = None
-    for i, p in enumerate(sale_pattern):
-        match = p.search(line)
-        if match:
-            # print('{}: {}'.format(i, line))
-            break
+    i, match = sale_pattern.search(line)
     if not match:
         print('NO MATCH: {}'.format(line))
         return {}
 
     sale = {
-        'consignor_name': match.group('name'),
-        'cattle_head': match.group('head'),
+        'consignor_name': match['name'],
+        'cattle_head': match['head'],
         'cattle_cattle': heading + ' ',
         }
-    sale_location = get_sale_location(match.group('location'))
+    sale_location = get_sale_location(match['location'])
     sale.update({
         'consignor_city': sale_location[0].title(),
         'consignor_state': sale_location[1].upper(),
         })
 
-    weight_match = re.search(r'[0-9,]+$', match.group('cattle').strip())
+    weight_match = re.search(r'[0-9,]+$', match['cattle'].strip())
     if weight_match:
         sale['cattle_avg_weight'] = weight_match.group(0).replace(',', '')
-        sale['cattle_cattle'] += match.group('cattle').replace(weight_match.group(0), '').strip()
+        sale['cattle_cattle'] += match['cattle'].replace(weight_match.group(0), '').strip()
     else:
-        sale['cattle_cattle'] += match.group('cattle').strip()
+        sale['cattle_cattle'] += match['cattle'].strip()
 
     if re.search(r'pair|bred', heading, re.IGNORECASE):
         price_type = 'cattle_price'
     else:
         price_type = 'cattle_price_cwt'
-    sale[price_type] = re.sub(r'[^0-9\.]', '', match.group('price'))
+    sale[price_type] = re.sub(r'[^0-9\.]', '', match['price'])
 
     sale = {k: re.sub(r'\s+', ' ', v.strip()) for k, v in sale.items() if v.strip()}
 
@@ -196,6 +189,9 @@ def write_sale(line, default_sale, writer):
 
 def main():
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+    temp_raw = scrape_util.ReportRaw(argv, prefix)
+
     # Locate existing CSV files
     archive = scrape_util.ArchiveFolder(argv, prefix)
 
@@ -228,7 +224,7 @@ def main():
         if not io_name:
             continue
 
-        line = get_sale_document(this_report)
+        line = get_sale_document(this_report, base_url, temp_raw)
         if not line:
             continue
 
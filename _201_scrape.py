@@ -1,19 +1,16 @@
 import csv
-from urllib.request import Request, urlopen
 from datetime import date
 import re
 from sys import argv
-from os import system
 import scrape_util
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = '/market_cards/scan.PDF'
-temp_raw = scrape_util.ReportRaw(argv, prefix)
 #CONVERT_SPEC = '-density 600 {!s} -crop 2400x4000+100+1800 -threshold 20% -deskew 40% -morphology close disk:3 -threshold 30%'
 #CONVERT_SPEC = '-density 600 {!s} -crop 2400x4000+100+1800 -threshold 50% -deskew 40% -morphology close disk:3 -threshold 30%'
-CONVERT_SPEC = '-density 600 {!s} -crop 2400x4400+100+1200 -threshold 20% -deskew 40% -morphology close disk:3 -threshold 30%'
-sale_pattern = [
+CONVERT_DENSITY = '600'
+CONVERT_SPEC = '-crop 2400x4400+100+1200 -threshold 20% -deskew 40% -morphology close disk:3 -threshold 30%'
+sale_pattern = scrape_util.PatternSet([
     re.compile(
         r'(?P<city>.*?)[\.,\s]+'
         r'(?P<state>' + scrape_util.state + ')'
@@ -37,7 +34,7 @@ sale_pattern = [
         r'\$(?P<price>[0-9,\.]+)(?P<hd>/hd)?',
         re.IGNORECASE,
         ),
-    ]
+    ])
 
 
 def get_sale_date(line):
@@ -94,31 +91,28 @@ def get_sale(line, cattle):
 
     line = re.sub(r'\b1X\b', 'TX', line)
 
-    for idx, p in enumerate(sale_pattern):
-        match = p.search(line)
-        if match:
-            break
+    idx, match = sale_pattern.search(line)
 
     price_type = 'cattle_price_cwt'
-    if match.group('hd'):
+    if match['hd']:
         price_type = 'cattle_price'
     sale = {
-        'consignor_city': match.group('city').title(),
-        'cattle_cattle': ' '.join([cattle, match.group('cattle').strip()]),
-        price_type: match.group('price').replace(',', ''),
+        'consignor_city': match['city'].title(),
+        'cattle_cattle': ' '.join([cattle, match['cattle'].strip()]),
+        price_type: match['price'].replace(',', ''),
         }
     if idx==0:
         sale.update({
-            'consignor_state': match.group('state').upper(),
-            'cattle_avg_weight': match.group('weight'),
+            'consignor_state': match['state'].upper(),
+            'cattle_avg_weight': match['weight'],
             })
     elif idx==1:
         sale.update({
-            'consignor_state': match.group('state').upper(),
+            'consignor_state': match['state'].upper(),
             })
     elif idx==2:
         sale.update({
-            'cattle_avg_weight': match.group('weight'),
+            'cattle_avg_weight': match['weight'],
             })
 
     sale = {k: v.strip() for k, v in sale.items()}
@@ -142,6 +136,9 @@ def write_sale(line, this_default_sale, writer):
 
 def main():
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+    temp_raw = scrape_util.ReportRaw(argv, prefix)
+
     # Locate existing CSV files
     archive = scrape_util.ArchiveFolder(argv, prefix)
 
@@ -151,37 +148,29 @@ def main():
     for this_report in report:
 
         # Get PDF report
-        request = Request(
-            base_url + report_path,
-            headers=scrape_util.url_header,
-            )
-        with urlopen(request) as io:
-            response = io.read()
-        with temp_raw.open('wb') as io:
-            io.write(response)
-
-        # Convert PDF to JPG and do OCR
-        temp_img = temp_raw.with_suffix('.png')
-        convert = scrape_util.convert.format(CONVERT_SPEC.format(temp_raw), '', str(temp_img))
-        system(convert)
-        temp_txt = temp_raw.with_suffix('.txt')
-        tesseract = scrape_util.tesseract.format(
-            str(temp_img),
-            str(temp_txt.with_suffix('')),
-            prefix,
-            )
-        system(tesseract)
-        with temp_txt.open('r') as io:
-            line = io.read()
-        temp_raw.clean(dirty=False)
+        pdf_url = base_url + report_path
+        temp_raw.fetch(pdf_url)
 
-        # Clean-up
-        line = line.splitlines()
+        # Stop iteration if this scan was already converted and archived
+        if archive.is_archived(digest=temp_raw.digest()):
+            temp_raw.clean()
+            break
+
+        # Read the text layer, or convert pages without one to PNG and do OCR
+        line = temp_raw.pdf_to_lines(
+            ocr=True,
+            density=CONVERT_DENSITY,
+            convert_option=CONVERT_SPEC.split(),
+            config=[prefix],
+            image_suffix='.png',
+            )
+        digest = temp_raw.clean(dirty=False)
 
         # Stop iteration if this report is already archived
         sale_date = get_sale_date(line)
         if not sale_date:
             continue
+        archive.record(pdf_url, digest, sale_date)
         io_name = archive.new_csv(sale_date)
         if not io_name:
             break
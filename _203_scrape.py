@@ -9,7 +9,6 @@ import scrape_util
 from datetime import date
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_url = 'pastmarketreports.html'
 first_year = 2014
 strip_char = ':;,. \n\t-'
@@ -48,7 +47,7 @@ def is_sale(td_text, tr):
         result = False
     elif re.search(r'sold for', text, re.IGNORECASE):
         result = False
-    elif is_number(td_text[1]):
+    elif scrape_util.is_number_token(td_text[1]):
         result = False
     elif re.search(r'\d+\s+TO\s+\d+', text):
         result = False
@@ -67,17 +66,6 @@ def has_span(this_tr):
     return is_span
 
 
-def is_number(string):
-    """Test whether a string is numeric. Ignoring units like 'cwt' and 'hd'."""
-
-    string = re.sub(r'\$|[,-/]|cwt|he?a?d?', '', string, flags = re.IGNORECASE)
-    try:
-        float(string)
-        return True
-    except ValueError:
-        return False
-
-
 def get_sale(td_text, heading):
     """Convert the input into a dictionary, with keys matching
     the CSV column headers in the scrape_util module.
@@ -103,7 +91,7 @@ def get_sale(td_text, heading):
         }
 
     cattle = td_text[2].split()
-    if is_number(cattle[0]):
+    if scrape_util.is_number_token(cattle[0]):
         sale['cattle_head'] = cattle.pop(0)
 
     cattle = ' '.join([heading] + cattle)
@@ -143,6 +131,8 @@ def write_sale(tr, writer, this_default_sale):
 
 def main():
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
     archive = scrape_util.ArchiveFolder(argv, prefix)
 
     # "pastmarketreports" with consistent style begin in 2014, around April
@@ -9,8 +9,6 @@ from os import system
 import scrape_util
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
-temp_raw = scrape_util.ReportRaw(argv, prefix)
 strip_char = ';,. \n\t'
 
 
@@ -70,22 +68,12 @@ def get_sale_location(word):
     return sale_location
 
 
-def is_number(string):
-
-    string = re.sub(r'\$|[,-/]|cwt|he?a?d?', '', string, flags = re.IGNORECASE)
-    try:
-        float(string)
-        return True
-    except ValueError:
-        return False
-
-
 def get_sale(word):
     """Convert the input into a dictionary, with keys matching
     the CSV column headers in the scrape_util module.
     """
     
-    number_word = list(idx for idx in range(len(word)) if is_number(word[idx]))
+    number_word = list(idx for idx in range(len(word)) if scrape_util.is_number_token(word[idx]))
     if number_word[0] in [0,1]:
         number_word = number_word[1:]
         
@@ -147,6 +135,9 @@ def write_sale(line, this_default_sale, writer):
 
 def main():
     
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+    temp_raw = scrape_util.ReportRaw(argv, prefix)
+
     # Get URLs for all reports
     request = Request(
         base_url + '/sale-reports',
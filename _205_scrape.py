@@ -1,14 +1,12 @@
 import csv
 from urllib.request import Request, urlopen
 from urllib.error import HTTPError
-import dateutil.parser
 import re
 from sys import argv
 from bs4 import BeautifulSoup
 import scrape_util
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path_1 = 'market_report/more'
 report_path_2 = 'market_report/report/?date='
 strip_char = ';,. \n\t'
@@ -18,7 +16,7 @@ def get_sale_date(link):
 
     """Return the date of the livestock sale."""
 
-    sale_date = dateutil.parser.parse(link, fuzzy=True)
+    sale_date = scrape_util.parse_sale_date(link)
 
     return sale_date
 
@@ -90,6 +88,8 @@ def write_sale(line, this_default_sale, writer):
 
 
 def main():
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
     # Get URLs for all reports
     request = Request(
         base_url + report_path_1,
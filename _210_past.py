@@ -3,11 +3,9 @@ import dateutil.parser
 import re
 from pathlib import Path
 from sys import argv
-from os import system
 import scrape_util
 
  
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 strip_char = ';,. \n\t'
 
 
@@ -170,9 +168,12 @@ def write_sale(line, this_default_sale, writer):
 
 def main():
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
     report_path = Path(argv[0]).parent / Path(prefix + '_past')
     past_report = report_path.glob('*.pdf')
     archive = scrape_util.ArchiveFolder(argv, prefix)
+    text = scrape_util.TextCache(argv, prefix)
 
     for this_report in past_report:
 
@@ -190,10 +191,8 @@ def main():
             'sale_day': sale_date.day,
             })
 
-        system(scrape_util.pdftotext.format(str(this_report)))
-        this_report_txt = this_report.with_suffix('.txt')
-        with this_report_txt.open('r') as io:
-            line = list(this_line.strip() for this_line in io)
+        digest = scrape_util.archive_digest(this_report)
+        line = list(this_line.strip() for this_line in text.pdf_to_lines(this_report, digest=digest))
 
         sale_head = get_sale_head(line)
         this_default_sale['sale_head'] = sale_head
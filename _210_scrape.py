@@ -8,7 +8,6 @@ from bs4 import BeautifulSoup
 import scrape_util
  
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = '/cattle-sales/market-report'
 strip_char = ';,. \n\t'
 #match_description = re.compile(r', ?([a-z]+ ?[0-9]+ ?, ?[0-9]+)', re.IGNORECASE)
@@ -160,6 +159,8 @@ def write_sale(line, this_default_sale, writer):
 
 def main():
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
     # Collect individual reports into a list
     request = Request(
         base_url + report_path,
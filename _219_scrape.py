@@ -6,8 +6,6 @@ from sys import argv
 from bs4 import BeautifulSoup
 import scrape_util
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
-base_url += 'index.cfm'
 report_path = ['?show=10&mid=7', '?show=10&mid=8']
 strip_char = ';,.# \n\t'
 
@@ -211,6 +209,9 @@ def write_sale(line, this_default_sale, writer):
 
 def main():
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+    base_url += 'index.cfm'
+
     # Get URLs for all reports
     for this_report_path in report_path:
         request = Request(
@@ -1,28 +1,22 @@
 import csv
-from itertools import groupby
-from selenium import webdriver
-from time import sleep
-import dateutil.parser
 import re
 from sys import argv
 import scrape_util
+import scrape_layout
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = 'market-report.html'
 strip_char = ';,. \n\t'
 clean_char = re.compile(r'\s*\n+\s*')
 head_pattern = re.compile(r'([0-9]+) head of cattle', re.IGNORECASE)
 date_pattern = re.compile(r'sale date:(.*)', re.IGNORECASE)
 price_pattern = re.compile('\.\d{2}$')
-PIXEL_GAP = 22
-SECOND_COLUMN = 500
 
 
 def get_sale_date(link):
     """Return the date of the livestock sale."""
 
-    sale_date = dateutil.parser.parse(link, fuzzy = True)
+    sale_date = scrape_util.parse_sale_date(link, future=True)
         
     return sale_date
 
@@ -35,17 +29,6 @@ def is_sale(line):
     return (not is_upper) and right_length and bool(has_price) and (not ranges)
 
 
-def is_number(string):
-    """Test whether a string is numeric. Ignoring units like 'cwt' and 'hd'."""
-
-    string = re.sub(r'\$|[,-/]|cwt|he?a?d?', '', string, flags = re.IGNORECASE)
-    try:
-        float(string)
-        return True
-    except ValueError:
-        return False
-    
-
 def get_sale(line):
     """Convert the input into a dictionary, with keys matching
     the CSV column headers in the scrape_util module.
@@ -63,7 +46,7 @@ def get_sale(line):
     if not types:
         types = text.pop().split()
 
-    if is_number(types[0]):
+    if scrape_util.is_number_token(types[0]):
         cattle_head = types.pop(0)
     else:
         cattle_head = ''
@@ -101,6 +84,8 @@ def write_sale(line, this_default_sale, writer):
 
 def main():
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
     archive = scrape_util.ArchiveFolder(argv, prefix)
 
     # request = Request(
@@ -118,34 +103,11 @@ def main():
     for this_report in report:
 
         # Extract table from table-like collection of div elements.
-        phantom = webdriver.PhantomJS()
-        phantom.get(base_url + report_path)
-        sleep(1)
-
-        content = []
-        for div in phantom.find_elements_by_css_selector("div.txt"):
-            for p in div.find_elements_by_tag_name('p'):
-                y = p.location['y']
-                x = p.location['x']
-                if x > SECOND_COLUMN:
-                    y += PIXEL_GAP / 2
-                for text in p.text.splitlines():
-                    content.append([y, x, text])
-                    y += PIXEL_GAP
-        content.sort(key = lambda x: x[:2])
-        y = 0
-        last_y = content[0][0]
-        for row in content:
-            this_y = row[0]
-            if (this_y - last_y) >= PIXEL_GAP:
-                last_y = this_y
-                y += 1
-            row[0] = y
-        line = []
-        for _, g in groupby(content, key=lambda text: text[0]):
-            this_line = sorted(list(g), key=lambda text: text[1])
-            line.append([text[-1] for text in this_line])
-            
+        scrape_util.browser_get(base_url + report_path, 'div.txt p')
+
+        text = scrape_util.browser_text('div.txt p')
+        line = scrape_layout.segments(text)
+
         for this_line in line:
             match = date_pattern.search(' '.join(this_line))
             if match:
@@ -3,12 +3,10 @@ from urllib.request import Request, urlopen
 import dateutil.parser
 import re
 from sys import argv
-from bs4 import BeautifulSoup
 import json
 import scrape_util
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = 'events.json.php'
 strip_char = ';,. \n\t'
 
@@ -24,13 +22,15 @@ def get_sale_date(string):
     return sale_date
     
 
-def get_sale_head(soup):
+def get_sale_head(document):
     """Return the head of the livestock sale."""
 
     head = None
-    head_string = soup.find('h3')
-    if head_string:
-        head_string = head_string.get_text()
+    if document is None:
+        return head
+    head_string = document.find('.//h3')
+    if head_string is not None:
+        head_string = head_string.xpath('string()')
         head_match = re.match('([0-9,]+) ?head', head_string, re.IGNORECASE)
         if head_match:
             head = head_match.group(1).replace(',','')
@@ -41,11 +41,10 @@ def get_sale_head(soup):
 def is_sale(line):
     """Determine whether a given line describes a sale of cattle."""
 
-    td = line.find_all('td')
-    is_not_succinct = len(td) > 3
+    is_not_succinct = len(line) > 3
     has_price = False
-    for this_td in td:
-        if re.search(r'[0-9]+\.[0-9]{2}', this_td.get_text()):
+    for this_td in line:
+        if re.search(r'[0-9]+\.[0-9]{2}', this_td):
             has_price = True
             break
 
@@ -67,23 +66,12 @@ def get_sale_location(sale_location):
     return sale_location
 
 
-def is_number(string):
-    """Test whether a string is numeric. Ignoring units like '$', 'cwt' and 'hd'."""
-
-    string = re.sub(r'\$|[,-/]|cwt|he?a?d?', '', string, flags = re.IGNORECASE)
-    try:
-        float(string)
-        return True
-    except ValueError:
-        return False
-
-
 def get_sale(word):
     """Convert the input into a dictionary, with keys matching
     the CSV column headers in the scrape_util module.
     """
 
-    number_word = [idx for idx, val in enumerate(word) if is_number(val)]
+    number_word = [idx for idx, val in enumerate(word) if scrape_util.is_number_token(val)]
 
     if len(number_word) < 2:
         return {}
@@ -138,15 +126,16 @@ def write_sale(line, this_default_sale, writer):
     
     for this_line in line:
         if is_sale(this_line):
-            word = [td.get_text().strip() for td in this_line.find_all('td')]
             sale = this_default_sale.copy()
-            sale.update(get_sale(word))
+            sale.update(get_sale(list(this_line)))
             if sale != this_default_sale:
                 writer.writerow(sale)
 
 
 def main():
     
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
     # Get URLs for all reports
     request = Request(
         base_url + report_path,
@@ -185,10 +174,11 @@ def main():
             )
 
         with urlopen(request) as io:
-            soup = BeautifulSoup(io.read(), 'lxml')
+            html = io.read()
+        document = scrape_util.html_document(html)
 
         # Initialize the default sale dictionary
-        sale_head = get_sale_head(soup)
+        sale_head = get_sale_head(document)
         this_default_sale = default_sale.copy()
         this_default_sale.update({
             'sale_year': sale_date.year,
@@ -197,13 +187,8 @@ def main():
             'sale_head': sale_head,
             })
 
-        line = []
+        line = list(scrape_util.html_table_rows(document, cell=('td',)))
 
-        table = soup.find('table')
-        
-        for tr in table.find_all('tr'):
-            line.append(tr)
-        
         # Open a new CSV file and write each sale
         with io_name.open('w', encoding='utf-8') as io:
             writer = csv.DictWriter(io, scrape_util.header, lineterminator='\n')
@@ -1,13 +1,11 @@
 import csv
 from urllib.request import Request, urlopen
-import dateutil.parser
 import re
 from sys import argv
 from bs4 import BeautifulSoup
 import scrape_util
 
  
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = 'topsellers.html'
 strip_char = ';,. \n\t'
 cattle_clue = r'(bulls?|steers?|strs?|cows?|heifers?|hfrs?|calf|calves|pairs?|head)'
@@ -20,7 +18,7 @@ def get_sale_date(title):
 #    date_string = title[number[0]] + title[number[1]]
     match = re.search(r'[0-9/\-]+', title)
     date_string = match.group(0)
-    sale_date = dateutil.parser.parse(date_string, fuzzy=True)
+    sale_date = scrape_util.parse_sale_date(date_string, future=True)
     return sale_date
 
 
@@ -96,6 +94,8 @@ def write_sale(line, this_default_sale, writer):
 
 def main():            
     
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
     # Get URLs for all reports
     request = Request(
         base_url + report_path,
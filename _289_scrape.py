@@ -8,7 +8,6 @@ from dateutil import parser
 import scrape_util
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = 'php/archives.php'
 strip_char = ';,. \n\t\r'
 
@@ -124,6 +123,8 @@ def get_sale(word):
 
 def main():
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
     # get URLs for historical reports
     request = Request(
         'http://www.glasgowstockyards.com/php/oldreports.php',
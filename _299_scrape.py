@@ -8,14 +8,13 @@ from bs4 import BeautifulSoup
 import scrape_util
 
  
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = 'index_files/Page452.htm'
 report_date_path = 'index_files/Page648.htm'
 head_pattern = re.compile(r'([\d,]+) ?head', re.IGNORECASE)
 strip_char = ';,. \n\t'
 
 
-def get_sale_date():
+def get_sale_date(base_url):
     """Return the date of the sale."""
     
     request = Request(
@@ -81,22 +80,6 @@ def get_sale_location(word):
     return sale_location
 
 
-def is_number(string):
-    """Test whether a string is number-ish. Ignoring units like 'cwt' and 'hd'."""
-
-    if string:
-        string = re.sub(r'\$|[,-/]|cwt|he?a?d?', '', string, flags = re.IGNORECASE)
-        try:
-            float(string)
-            result = True
-        except ValueError:
-            result = False
-    else:
-        result = False
-
-    return result
-
-
 def get_sale(line):
     """Convert the input into a dictionary, with keys matching
     the CSV column headers in the scrape_util module.
@@ -153,6 +136,8 @@ def write_sale(line, this_default_sale, writer):
 
 def main():            
     
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
     # Collect individual reports into a list
     request = Request(
         base_url + report_path,
@@ -168,7 +153,7 @@ def main():
     # Write a CSV file for each report not in the archive
     for this_report in report:
 
-        sale_date = get_sale_date()
+        sale_date = get_sale_date(base_url)
         io_name = archive.new_csv(sale_date)
 
         # Stop iteration if this report is already archived
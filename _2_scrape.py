@@ -1,5 +1,4 @@
 import csv
-import requests
 import re
 from sys import argv
 from bs4 import BeautifulSoup
@@ -8,7 +7,6 @@ import scrape_util
 
 
 which_button = 0
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 
 
 def has_range(word):
@@ -114,11 +112,10 @@ def get_sale(word):
 
 def main():
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
     # Get URLs for historical reports
-    response = requests.get(
-        base_url,
-        headers=scrape_util.url_header,
-        )
+    response = scrape_util.http_get(base_url)
     soup = BeautifulSoup(response.content, 'lxml')
     button = soup.find('select', attrs = {'name' : 'reportID' })
     option = button.find_all('option')
@@ -139,10 +136,7 @@ def main():
         if not io_name:
             break
 
-        response = requests.get(
-            this_report[1],
-            headers=scrape_util.url_header,
-            )
+        response = scrape_util.http_get(this_report[1])
         soup = BeautifulSoup(response.content, 'lxml')
         div = soup.find_all('div', attrs={'class': 'sml'})[2]
         div.table.extract()
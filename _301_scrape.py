@@ -1,6 +1,5 @@
 import csv
 from urllib.request import Request, urlopen
-import dateutil.parser
 from datetime import date
 import re
 from sys import argv
@@ -8,7 +7,6 @@ from bs4 import BeautifulSoup
 import scrape_util
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 #report_path = 'actual-sales-from-this-week/'
 report_path = ''
 strip_char = ';,. \n\t\xa0'
@@ -24,7 +22,7 @@ def get_sale_date(content):
         date_string = [date_string.replace(match.group(0), match.group(idx)) for idx in [1, 3]]
     else:
         date_string = [date_string]
-    sale_date = [dateutil.parser.parse(this_string, fuzzy=True).date() for this_string in date_string]
+    sale_date = [scrape_util.parse_sale_date(this_string, future=True) for this_string in date_string]
     if sale_date[-1] == date.today():
         sale_date = []
 
@@ -154,6 +152,8 @@ def write_sale(line, this_default_sale, writer):
 
 def main():            
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
     # Locate existing CSV files
     archive = scrape_util.ArchiveFolder(argv, prefix)
 
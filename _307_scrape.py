@@ -1,13 +1,11 @@
 import csv
 import re
-import dateutil.parser
 import scrape_util
 from urllib.request import Request, urlopen
 from sys import argv
 from bs4 import BeautifulSoup
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 strip_char = ';,. \n\t'
 
 
@@ -18,7 +16,7 @@ def get_sale_date(date_head):
     reportmd = report_date[0].split()[-2:]
     reportmd.append(report_date[-1])
     date_string = str(reportmd)
-    sale_date = dateutil.parser.parse(date_string, fuzzy = True)
+    sale_date = scrape_util.parse_sale_date(date_string, future=True)
     return sale_date
 
 
@@ -83,6 +81,8 @@ def write_sale(line, default_sale, writer):
 
 def main():
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
     # Locate existing CSV files
     archive = scrape_util.ArchiveFolder(argv, prefix)
 
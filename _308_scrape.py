@@ -9,10 +9,8 @@ import scrape_util
 from datetime import datetime, timedelta
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = '/Market_Report.html'
 strip_char = ';,. \n\t'
-temp_raw = scrape_util.ReportRaw(argv, prefix, suffix='jpg')
 
 
 def get_sale_date(this_report):
@@ -125,6 +123,9 @@ def write_sale(line, this_default_sale, writer):
 
 def main():            
     
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+    temp_raw = scrape_util.ReportRaw(argv, prefix, suffix='jpg')
+
     # Get URLs for all reports
     request = Request(
         base_url + report_path,
@@ -174,6 +175,9 @@ def main():
 
 def catchup():
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+    temp_raw = scrape_util.ReportRaw(argv, prefix, suffix='jpg')
+
     # Locate existing CSV files
     archive = scrape_util.ArchiveFolder(argv, prefix)
 
@@ -8,8 +8,6 @@ from dateutil import parser
 import scrape_util
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
-base_url = base_url[:-1]
 strip_char = ';,. \n\t$'
 
 
@@ -86,6 +84,9 @@ def get_sale(word, cattle):
 
 def main():
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+    base_url = base_url[:-1]
+
     # get URLs for all reports
     request = Request(
         base_url,
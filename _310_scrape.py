@@ -4,17 +4,13 @@ import urllib.error
 import dateutil.parser
 import datetime
 import re
-import xlrd
 from sys import argv
 from bs4 import BeautifulSoup
 from os import system
 import scrape_util
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = 'market-report.php'
-temp_pdf = scrape_util.ReportRaw(argv, prefix, suffix='pdf')
-temp_xlsx = scrape_util.ReportRaw(argv, prefix, suffix='xlsx')
 strip_char = ';,. \n\t'
 
 
@@ -39,43 +35,30 @@ def get_sale_date(this_report):
     return sale_date
     
 
-def is_sale(word):
-    """Determine whether a given line describes a sale of cattle."""
+def is_sale(cell):
+    """Determine whether a given row of cells describes a sale of cattle."""
 
-    is_not_succinct = len(word) > 2
-    has_price = re.search(r'[0-9,]+\.[0-9]{1,2}', ' '.join(word))
+    is_not_succinct = len(cell) > 2
+    has_price = (
+        any(isinstance(this_cell, (int, float)) and not isinstance(this_cell, bool) for this_cell in cell)
+        or re.search(r'[0-9,]+\.[0-9]{1,2}', ' '.join(str(this_cell) for this_cell in cell))
+        )
     return all([is_not_succinct, has_price])
 
 
-def is_number(string):
-    """Test whether a string is number-ish. Ignoring units like 'cwt' and 'hd'."""
-
-    if string:
-        string = re.sub(r'\$|[,-/]|cwt|he?a?d?', '', string, flags = re.IGNORECASE)
-        try:
-            float(string)
-            result = True
-        except ValueError:
-            result = False
-    else:
-        result = False
-
-    return result
-
-
 def get_sale(word):
     """Convert the input into a dictionary, with keys matching
     the CSV column headers in the scrape_util module.
     """
 
     # Split head and cattle string if not split
-    if not is_number(word[1]):
+    if not scrape_util.is_number_token(word[1]):
         if re.match(r',.*',word[1]):
             word.pop(1)
         else:
             try:
                 head_string, cattle_string = word[1].split(maxsplit=1)
-                if is_number(head_string):
+                if scrape_util.is_number_token(head_string):
                     word.pop(1)
                     word.insert(1, head_string)
                     word.insert(2, cattle_string)
@@ -84,7 +67,7 @@ def get_sale(word):
             except ValueError:
                 word.insert(1, '0')
 
-    number_word = [idx for idx, val in enumerate(word) if is_number(val)]
+    number_word = [idx for idx, val in enumerate(word) if scrape_util.is_number_token(val)]
 
     if len(number_word) == 4:
         return {}
@@ -147,12 +130,18 @@ def get_sale(word):
     return sale
 
 
-def write_sale(line, this_default_sale, writer):
-    """Extract sales from a list of report lines and write them to a CSV file."""
+def write_sale(row, this_default_sale, writer):
+    """Extract sales from a list of report rows, each a list of cells,
+    and write them to a CSV file.
+    """
     
-    for this_line in line:
-        word = re.split(r'\s{2,}|\t', this_line.strip())
-        if is_sale(word):
+    for cell in row:
+        while cell and cell[-1] == '':
+            cell = cell[:-1]
+        while cell and cell[0] == '':
+            cell = cell[1:]
+        if is_sale(cell):
+            word = [scrape_util.cell_text(this_cell).replace('\n', '') for this_cell in cell]
             sale = this_default_sale.copy()
             sale.update(get_sale(word))
             if sale != this_default_sale:
@@ -161,6 +150,10 @@ def write_sale(line, this_default_sale, writer):
 
 def main():            
     
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+    temp_pdf = scrape_util.ReportRaw(argv, prefix, suffix='pdf')
+    temp_xlsx = scrape_util.ReportRaw(argv, prefix, suffix='xlsx')
+
     # Collect individual reports into a list
     request = Request(
         base_url + report_path,
@@ -209,6 +202,7 @@ def main():
         except urllib.error.HTTPError:
             continue
 
+        row = None
         if re.search(r'\.pdf$', report_url, re.IGNORECASE):
             temp_raw = temp_pdf
             with temp_raw.open('wb') as io:
@@ -222,35 +216,30 @@ def main():
             temp_raw = temp_xlsx
             with temp_raw.open('wb') as io:
                 io.write(response)
-            temp_txt = temp_raw.with_suffix('.txt')
-            with temp_txt.open('w', encoding='utf-8') as io:
-                wr = csv.writer(io, lineterminator='\n\n', delimiter='\t')
-                sheet = xlrd.open_workbook(str(temp_raw)).sheet_by_index(0)
-                for i in range(0, sheet.nrows):
-                    wr.writerow(sheet.row_values(i))
-            with temp_txt.open('r') as io:
-                text = io.read()
+            row = list(scrape_util.sheet_rows(temp_raw.raw))
             temp_raw.clean()
         elif re.search(r'\.txt$', report_url, re.IGNORECASE):            
             text = response.decode()
         else:
             continue
-            
-        text_line = re.split(r'\n\n|\n\x0c|\r\n', text.strip())
-        # ## the following was an erroneous attempt to deal with PDFs where the price column was on subsequent pages
-        # cut = len(text_line) // 2
-        # if next((False for line in text_line[cut:] if re.match(r'\$[\d\.]+', line)), True):
-        #     price = text_line[cut:]
-        #     text_line = text_line[:cut]
-        #     for idx, val in enumerate(price):
-        #         text_line[idx] += '  {}'.format(val)
-        line = [this_line.replace('\n', '') for this_line in text_line]
+
+        if row is None:
+            text_line = re.split(r'\n\n|\n\x0c|\r\n', text.strip())
+            # ## the following was an erroneous attempt to deal with PDFs where the price column was on subsequent pages
+            # cut = len(text_line) // 2
+            # if next((False for line in text_line[cut:] if re.match(r'\$[\d\.]+', line)), True):
+            #     price = text_line[cut:]
+            #     text_line = text_line[:cut]
+            #     for idx, val in enumerate(price):
+            #         text_line[idx] += '  {}'.format(val)
+            line = [this_line.replace('\n', '') for this_line in text_line]
+            row = [re.split(r'\s{2,}|\t', this_line.strip()) for this_line in line]
 
         # Open a new CSV file and write each sale
         with io_name.open('w', encoding='utf-8') as io:
             writer = csv.DictWriter(io, scrape_util.header, lineterminator='\n')
             writer.writeheader()
-            write_sale(line, this_default_sale, writer)
+            write_sale(row, this_default_sale, writer)
 
 
 if __name__ == '__main__':
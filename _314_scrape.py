@@ -7,7 +7,6 @@ from bs4 import BeautifulSoup
 import scrape_util
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = '?p=market'
 strip_char = ';,. \n\t'
 
@@ -31,7 +30,7 @@ def get_sale_head(header):
     header_string = header.string
     try:
         title_string, head_string, date_string = header_string.split(' - ')
-        if is_number(head_string):
+        if scrape_util.is_number_token(head_string):
             head_string = head_string.replace(',', '').replace('hd', '').strip(strip_char)
             head = int(head_string)
     except ValueError:
@@ -92,28 +91,12 @@ def get_sale_location(word):
     return sale_location
 
 
-def is_number(string):
-    """Test whether a string is number-ish. Ignoring units like 'cwt' and 'hd'."""
-
-    if string:
-        string = re.sub(r'\$|[,-/]|cwt|he?a?d?', '', string, flags = re.IGNORECASE)
-        try:
-            float(string)
-            result = True
-        except ValueError:
-            result = False
-    else:
-        result = False
-
-    return result
-
-
 def get_sale(word):
     """Convert the input into a dictionary, with keys matching
     the CSV column headers in the scrape_util module.
     """
     
-    number_word = [idx for idx, val in enumerate(word) if is_number(val)]
+    number_word = [idx for idx, val in enumerate(word) if scrape_util.is_number_token(val)]
     
     sale_location = get_sale_location(word[1:2])
     sale = {
@@ -175,6 +158,8 @@ def write_sale(line, this_default_sale, writer):
 
 def main():            
     
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
     # Collect individual reports into a list
     request = Request(
         base_url + report_path,
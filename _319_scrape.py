@@ -1,6 +1,5 @@
 import csv
 from urllib.request import Request, urlopen
-import dateutil.parser
 import re
 import datetime
 from sys import argv
@@ -8,7 +7,6 @@ from bs4 import BeautifulSoup
 import scrape_util
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = 'market%20reports.htm'
 strip_char = '$;,. \xa0\r\n\t'
 
@@ -31,8 +29,7 @@ def get_sale_date(line):
         date_string = line.strip()
     else:
         date_string = line.strip() + ' ' + str(year)
-    sale_date = dateutil.parser.parse(date_string, fuzzy=True)
-    sale_date = sale_date.date()
+    sale_date = scrape_util.parse_sale_date(date_string, future=True)
     if sale_date > today:
         sale_date = sale_date.replace(year=(sale_date.year - 1))
     
@@ -149,6 +146,8 @@ def write_sale(line, this_default_sale, writer):
 
 def main():            
     
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
     # Get URLs for all reports
     request = Request(
         base_url + report_path,
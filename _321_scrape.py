@@ -8,7 +8,6 @@ from datetime import date
 import scrape_util
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = 'BLA/print'
 
 
@@ -75,6 +74,8 @@ def write_sale(table, default_sale, writer):
 
 def main():
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
     # get URLs for all reports
     request = Request(
         base_url + report_path,
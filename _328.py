@@ -8,7 +8,6 @@ from datetime import date
 import scrape_util
  
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 strip_char = ';,. \n\t'
 
 
@@ -148,6 +147,8 @@ def write_sale(lines, this_default_sale, writer):
 
 def main():            
     
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
     # Get URLs for all reports
     request = Request(
         base_url,
@@ -3,21 +3,18 @@ from urllib.request import Request, urlopen
 import re
 from sys import argv
 from bs4 import BeautifulSoup
-import dateutil.parser
 from os import system
 import scrape_util
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = 'reports/archives.php'
 strip_char = ';,. \n\t'
-temp_raw = scrape_util.ReportRaw(argv, prefix)
     
 
 def get_sale_date(this_report):
     date_string = this_report.string
     date_string = re.sub(r'&.*?[0-9]+', '', date_string)
-    sale_date = dateutil.parser.parse(date_string, fuzzy = True)
+    sale_date = scrape_util.parse_sale_date(date_string)
     return sale_date
 
 
@@ -81,6 +78,9 @@ def get_sale(word):
 
 def main():
     
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+    temp_raw = scrape_util.ReportRaw(argv, prefix)
+
     # get URLs for all reports
     request = Request(
         base_url + report_path,
@@ -3,19 +3,16 @@ from urllib.request import Request, urlopen
 import re
 from sys import argv, platform
 from bs4 import BeautifulSoup
-import dateutil.parser
 from os import system
 import scrape_util
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = 'auction-results/'
-temp_raw = scrape_util.ReportRaw(argv, prefix)
 strip_char = ';,. \n\t\r'
     
 
 def get_sale_date(date):
     date_string = date[-1]
-    sale_date = dateutil.parser.parse(date_string, fuzzy = True)
+    sale_date = scrape_util.parse_sale_date(date_string, future=True)
     
     return sale_date
 
@@ -99,6 +96,9 @@ def write_sale(line, this_default_sale, writer):
 
 def main():
     
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+    temp_raw = scrape_util.ReportRaw(argv, prefix)
+
     # get URLs for all reports
     request = Request(
         base_url + report_path,
@@ -3,15 +3,12 @@ from urllib.request import Request, urlopen
 import re
 from sys import argv
 from bs4 import BeautifulSoup
-import dateutil.parser
 from datetime import date
 from os import system
 import scrape_util
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 strip_char = ';,. \n\t\r'
-temp_raw = scrape_util.ReportRaw(argv, prefix)
 # # to replace from raw
 # from pathlib import Path
 # base_url = 'file://{}'.format(Path('long_prairie_scrape/pdf').absolute())
@@ -19,8 +16,8 @@ temp_raw = scrape_util.ReportRaw(argv, prefix)
 
 def get_sale_date(line):
     date_string = ' '.join(line)
-    sale_date = dateutil.parser.parse(date_string, fuzzy=True).date()
-    if sale_date >= date.today():
+    sale_date = scrape_util.parse_sale_date(date_string)
+    if sale_date == date.today():
         sale_date = None
     
     return sale_date
@@ -118,6 +115,9 @@ def write_sale(line, this_default_sale, writer):
 
 def main():
     
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+    temp_raw = scrape_util.ReportRaw(argv, prefix)
+
     # get URLs for all reports
     request = Request(
         base_url,
@@ -9,9 +9,7 @@ import scrape_util
 from datetime import date
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 strip_char = ';,. \n\t\r'
-temp_raw = scrape_util.ReportRaw(argv, prefix)
 
 
 def get_sale_date(line):
@@ -118,6 +116,9 @@ def write_sale(line, this_default_sale, writer):
 
 def main():
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+    temp_raw = scrape_util.ReportRaw(argv, prefix)
+
     # Location of existing reports
     archive = scrape_util.ArchiveFolder(argv, prefix)
     
@@ -1,5 +1,4 @@
 import csv
-import requests
 import re
 import scrape_util
 import dateutil.parser
@@ -15,8 +14,6 @@ from pathlib import Path
 # "combine them at the end of the week"
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
-temp_raw = scrape_util.ReportRaw(argv, prefix)
 date_pattern = re.compile(r'PDFs/MarketReports/(?P<year>\d+)/\w+/(?P<month>\d+)-(?P<day>\d+).*\.pdf')
 head_pattern = re.compile(r'(?P<location>.*)(\u2013|-)[^\d\.]+(?P<receipts>[\d,]*)')
 rep_pattern = re.compile(r'rep(resentative)?\s+sales?:', re.IGNORECASE)
@@ -123,27 +120,36 @@ def write_sale(line, exist_sale, this_default_sale, writer):
 
 def main():
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+    temp_raw = scrape_util.ReportRaw(argv, prefix)
+
     # Locate existing CSV files
     archive = scrape_util.ArchiveFolder(argv, prefix)
 
     # Collect list of market reports
-    session = requests.Session()
-    session.headers.update(scrape_util.url_header)
-    response = session.get(url=(base_url + '/market-reports.html'))
+    listing = scrape_util.ListingCache(argv, prefix)
+    response = listing.get(base_url + '/market-reports.html')
+    if not response:
+        return
     soup = BeautifulSoup(response.content, 'lxml')
     report = [a for a in soup.find_all('a') if a.get('href', '').startswith('PDFs/MarketReports')]
 
-    # Process each market report
+    # Process each market report, saving the listing only if every report
+    # had a date
+    is_complete = True
     for this_report in report:
 
         # Stop iteration if this report is already archived
         sale_date = get_sale_date(this_report['href'])
+        if not sale_date:
+            is_complete = False
+            continue
         io_name = archive.new_csv(sale_date)
         if not io_name:
             continue
 
         # Request the report PDF and convert to TXT
-        response = session.get(url=(base_url + this_report['href']))
+        response = scrape_util.http_get(url=(base_url + this_report['href']))
         with temp_raw.open('wb') as io:
             io.write(response.content)
         system(scrape_util.pdftotext.format(str(temp_raw)))
@@ -194,6 +200,9 @@ def main():
             writer.writeheader()
             write_sale(line, exist_sale, this_default_sale, writer)
 
+    if is_complete:
+        listing.save()
+
 
 if __name__ == '__main__':
     main()
@@ -6,11 +6,9 @@ from sys import argv
 from bs4 import BeautifulSoup
 from dateutil import parser
 from datetime import date
-import xlrd
 import scrape_util
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = 'market_reports.html'
 min_date = date(2014, 10, 1)
 
@@ -56,15 +54,6 @@ def is_heading(this_row):
     return has_cattle and not has_number
 
 
-def is_number(string):
-    string = re.sub(r'\$|/?cwt|/?hd|,', '', string, flags = re.IGNORECASE)
-    try:
-        float(string)
-        return True
-    except ValueError:
-        return False
-
-
 def get_sale_location(word):
 
     sale_location = ' '.join(word)
@@ -87,7 +76,7 @@ def get_sale(word, cattle):
         word[0] = word[0].replace(match.group(1), '')
         word.insert(0, match.group(1))
 
-    number_word = list(idx for idx in range(len(word)) if is_number(word[idx]))
+    number_word = list(idx for idx in range(len(word)) if scrape_util.is_number_token(word[idx]))
     sale_location = get_sale_location(word[number_word[-1] + 1:])
     cattle_string = ' '.join(word[number_word[0] + 1:number_word[1]]) + ' ' + cattle
     sale = {
@@ -137,6 +126,8 @@ def write_sale(line, default_sale, writer):
 
 def main():
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
     # get URLs for all reports
     request = Request(
         base_url + report_path,
@@ -191,8 +182,10 @@ def main():
             temp_raw = scrape_util.ReportRaw(argv, prefix, suffix=match.group(1))
             with temp_raw.open('wb') as io:
                io.write(response)
-            sheet = xlrd.open_workbook(str(temp_raw)).sheet_by_index(0)
-            line = [[re.sub(r'\.0$', '', str(td)) for td in sheet.row_values(idx)] for idx in range(0, sheet.nrows)]
+            line = [
+                [scrape_util.cell_text(td) for td in row]
+                for row in scrape_util.sheet_rows(temp_raw.raw)
+                ]
             temp_raw.clean()
         else:
             soup = BeautifulSoup(response, 'lxml')
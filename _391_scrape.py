@@ -2,18 +2,16 @@ import csv
 import re
 from urllib.request import Request, urlopen
 from datetime import date
-import dateutil.parser
 from sys import argv
 from bs4 import BeautifulSoup
 import scrape_util
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = 'category/current-sale-report/'
 
 
 def get_sale_date(date_string):
-    sale_date = dateutil.parser.parse(date_string, fuzzy=True).date()
+    sale_date = scrape_util.parse_sale_date(date_string)
     return sale_date
 
 
@@ -67,6 +65,8 @@ def write_sale(line, default_sale, writer):
 
 def main():
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
     # Locate existing CSV files
     archive = scrape_util.ArchiveFolder(argv, prefix)
 
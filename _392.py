@@ -1,5 +1,4 @@
 import csv
-import requests
 import dateutil.parser
 import re
 from os import system
@@ -8,8 +7,6 @@ from bs4 import BeautifulSoup
 import scrape_util
 
 
-temp_raw = scrape_util.ReportRaw(argv, prefix)
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = 'Market-Reports.php'
 strip_char = ';,. \n\t'
 
@@ -53,35 +50,19 @@ def get_sale_location(word):
     return sale_location
 
 
-def is_number(string):
-    """Test whether a string is number-ish. Ignoring units like 'cwt' and 'hd'."""
-
-    if string:
-        string = re.sub(r'\$|[,-/]|cwt|he?a?d?', '', string, flags = re.IGNORECASE)
-        try:
-            float(string)
-            result = True
-        except ValueError:
-            result = False
-    else:
-        result = False
-
-    return result
-
-
 def get_sale(word):
     """Convert the input into a dictionary, with keys matching
     the CSV column headers in the scrape_util module.
     """
 
     # Join price with unit of price if separated
-    if not is_number(word[len(word)-1]):
+    if not scrape_util.is_number_token(word[len(word)-1]):
         price_word = ' '.join(word[len(word)-2:])
         word.pop()
         word.pop()
         word.append(price_word)
 
-    number_word = [idx for idx, val in enumerate(word) if is_number(val)]
+    number_word = [idx for idx, val in enumerate(word) if scrape_util.is_number_token(val)]
 
     # Skip lines with four or more number words
     if len(number_word) not in [2, 3]:
@@ -161,7 +142,10 @@ def write_sale(line, this_default_sale, writer):
 
 def main():            
     
-    response = requests.get(base_url + report_path, headers=scrape_util.url_header)
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+    temp_raw = scrape_util.ReportRaw(argv, prefix)
+
+    response = scrape_util.http_get(base_url + report_path)
     soup = BeautifulSoup(response.content, 'lxml')
     div = soup.find_all('div', attrs={'class':'File_Default'})
     report = [this_div.a for this_div in div]
@@ -175,7 +159,7 @@ def main():
 
         # create temporary text file from downloaded pdf
         pdf_url = base_url + this_report['href']
-        response = requests.get(pdf_url, headers=scrape_util.url_header)
+        response = scrape_util.http_get(pdf_url)
         with temp_raw.open('wb') as io:
             io.write(response.content)
         system(scrape_util.pdftotext.format(str(temp_raw)))
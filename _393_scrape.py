@@ -1,5 +1,4 @@
 import csv
-import requests
 import re
 import scrape_util
 import dateutil.parser
@@ -7,7 +6,6 @@ from sys import argv
 from bs4 import BeautifulSoup
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = 'custom/market-reports'
 
 
@@ -72,9 +70,9 @@ def write_sale(report, this_default_sale, writer):
 
 def main():
 
-    session = requests.Session()
-    session.headers.update(scrape_util.url_header)
-    response = session.get(
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
+    response = scrape_util.http_get(
         url=base_url + report_path,
         )
     soup = BeautifulSoup(response.content, 'lxml')
@@ -92,7 +90,7 @@ def main():
     for this_report_type in report_type:
 
         data = post_data(soup, this_report_type)
-        response = session.post(
+        response = scrape_util.http_post(
             base_url + report_path,
             data=data,
             headers={'Referer': base_url}
@@ -116,7 +114,7 @@ def main():
                 continue
 
             data = post_data(soup, this_report_type, this_report_date, True)
-            response = session.post(
+            response = scrape_util.http_post(
                 url=base_url + report_path,
                 data=data,
                 headers={'Referer': base_url}
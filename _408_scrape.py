@@ -1,5 +1,4 @@
 import re
-import requests
 import scrape_util
 import csv
 from sys import argv
@@ -10,8 +9,6 @@ from datetime import date, timedelta
 from pathlib import Path
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
-base_url = base_url.replace('http', 'https')
 params = {'access_token': '|'.join(['1774881112740993', 'fca3df22db43197e4768b8448a31c365'])}
 head_pattern = re.compile(r'headcount:?\s*(?P<head>\d+)', re.IGNORECASE)
 cattle_pattern = [
@@ -148,13 +145,14 @@ def write_sale(line, this_default_sale, writer):
 
 def main():
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+    base_url = base_url.replace('http', 'https')
+
     # Locate existing CSV files
     archive = scrape_util.ArchiveFolder(argv, prefix)
 
     # Collect list of market reports
-    session = requests.Session()
-    session.headers.update(scrape_util.url_header)
-    response = session.get(url=base_url, params=params)
+    response = scrape_util.http_get(url=base_url, params=params)
 
     paging = True
     while paging:
@@ -199,7 +197,7 @@ def main():
 
         # Continue to next page
         if io_name and 'paging' in feed and 'next' in feed['paging']:
-            response = session.get(url=feed['paging']['next'])
+            response = scrape_util.http_get(url=feed['paging']['next'])
         else:
             paging = False
 
@@ -8,8 +8,6 @@ from dateutil import parser
 import scrape_util
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
-base_url += 'Markets/'
 report_path = 'index.php'
 strip_char = ';,. \n\t\\'
 
@@ -114,6 +112,9 @@ def get_sale(word, price_type):
 
 def main():
     
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+    base_url += 'Markets/'
+
     # get URLs for all reports
     request = Request(
         base_url + report_path,
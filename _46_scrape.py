@@ -8,10 +8,8 @@ from os import system
 import scrape_util
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = 'Market_Reports.html'
 strip_char = ';,. \n\t'
-temp_raw = scrape_util.ReportRaw(argv, prefix)
 sale_pattern = [
     re.compile(
         r'(?P<name>\S.*?)(?:\s{2,}|\s,\s+)'
@@ -92,15 +90,6 @@ def get_sale_location(word):
     return sale_location
 
 
-def is_number(string):
-    string = re.sub(r'\$|[,-/]|cwt|he?a?d?', '', string, flags = re.IGNORECASE)
-    try:
-        float(string)
-        return True
-    except ValueError:
-        return False
-        
-
 def get_sale(line):
 
     for pattern in sale_pattern:
@@ -115,7 +104,7 @@ def get_sale(line):
         'cattle_cattle': match.group('cattle').strip(strip_char).title(),
         }
 
-    # number_word = list(idx for idx in range(len(word)) if is_number(word[idx]))
+    # number_word = list(idx for idx in range(len(word)) if scrape_util.is_number_token(word[idx]))
     # comma_word = list(idx + 1 for idx in range(len(word)) if re.search(r',$', word[idx]))
 
     # if len(comma_word) == 0:
@@ -168,6 +157,9 @@ def get_sale(line):
 
 def main():
     
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+    temp_raw = scrape_util.ReportRaw(argv, prefix)
+
     # get URLs for all reports
     request = Request(
         base_url + report_path,
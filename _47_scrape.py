@@ -7,7 +7,6 @@ from bs4 import BeautifulSoup
 import scrape_util
 
  
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = 'Past%20Auction%20Results.htm'
 date_pattern = re.compile(r'\d{1,2}/\d{1,2}/\d{2,4}')
 head_pattern = re.compile(r'(?P<head>\d+)\s*(hd|head)?\s*sold', re.IGNORECASE)
@@ -144,6 +143,8 @@ def write_sale(line, this_default_sale, writer):
 
 def main():            
     
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
     # Collect individual reports into a list
     request = Request(
         base_url + report_path,
@@ -8,7 +8,6 @@ from bs4 import BeautifulSoup
 import scrape_util
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = 'market.htm'
 dash = b'\xe2\x80\x94'.decode()
 
@@ -114,6 +113,8 @@ def write_sale(line, default_sale, writer):
 
 def main():
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
     # locate existing CSV files
     archive = scrape_util.ArchiveFolder(argv, prefix)
 
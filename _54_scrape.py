@@ -8,7 +8,6 @@ from bs4 import BeautifulSoup
 import scrape_util
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = 'cattle-market/'
 
 
@@ -98,6 +97,8 @@ def write_sale(line, default_sale, writer):
 
 def main():
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
     # Locate existing CSV files
     archive = scrape_util.ArchiveFolder(argv, prefix)
 
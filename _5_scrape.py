@@ -8,7 +8,6 @@ from datetime import date
 import scrape_util
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = 'sale_reports/{}.offset'
 
 
@@ -76,7 +75,8 @@ def get_sale(text):
 
 class Report(object):
     
-    def __init__(self):
+    def __init__(self, base_url):
+        self.base_url = base_url
         self.offset = 0
     
     def __iter__(self):
@@ -86,7 +86,7 @@ class Report(object):
         # Reports are handled individually by incrementing the offset in the url
         # and taking the first 'vastQueryResulter' div
         request = Request(
-            base_url + report_path.format(self.offset),
+            self.base_url + report_path.format(self.offset),
             headers=scrape_util.url_header,
             )
         with urlopen(request) as io:
@@ -102,11 +102,13 @@ class Report(object):
 
 def main():
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
     # Identify existing reports
     archive = scrape_util.ArchiveFolder(argv, prefix)
 
     # Turn each report into a csv file
-    for this_report in Report():
+    for this_report in Report(base_url):
 
         # gather venue information from the <h6> tag        
         venue = this_report.h6.get_text().splitlines()
@@ -1,5 +1,4 @@
 import csv
-import xlrd
 from urllib.request import Request, urlopen
 import dateutil.parser
 import re
@@ -10,9 +9,7 @@ from os import system
 
 #url_stub = 'https://www.dropbox.com/sh/nz81bwpg2wuj5q7/AACxr0xlvESoJpXLqWcOfLv_a/Market%20Report.xlsx?raw=1'
 #temp_raw = scrape_util.ReportRaw(argv, prefix, suffix='xlsx')
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = 'market-reports.html'
-temp_raw = scrape_util.ReportRaw(argv, prefix)
 sale_pattern = [
     re.compile(
         r'(?P<head>[0-9]*)\s+'
@@ -128,6 +125,9 @@ def write_sale(line, this_default_sale, writer):
 
 def main():
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+    temp_raw = scrape_util.ReportRaw(argv, prefix)
+
     # Locate existing CSV files
     archive = scrape_util.ArchiveFolder(argv, prefix)
 
@@ -144,21 +144,22 @@ def main():
     # Write a CSV file for each report not in the archive
     for this_report in report:
 
-        request = Request(
-            base_url + this_report['href'],
-            headers = scrape_util.url_header,
-            )
-        with urlopen(request) as io:
-            response = io.read()
-        with temp_raw.open('wb') as io:
-            io.write(response)
+        pdf_url = base_url + this_report['href']
+        temp_raw.fetch(pdf_url)
+
+        # Stop iteration if this report was already converted and archived
+        if archive.is_archived(digest=temp_raw.digest()):
+            temp_raw.clean()
+            break
+
         system(scrape_util.pdftotext.format(str(temp_raw)))
         temp_txt = temp_raw.with_suffix('.txt')
         with temp_txt.open('r') as io:
             line = [this_line.strip() for this_line in io if this_line.strip()]
-        temp_raw.clean()
+        digest = temp_raw.clean()
 
         sale_date = get_sale_date(line)
+        archive.record(pdf_url, digest, sale_date)
         io_name = archive.new_csv(sale_date)
 
         # Stop iteration if this report is already archived
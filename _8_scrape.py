@@ -8,7 +8,6 @@ from dateutil import parser
 import scrape_util
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 strip_char = ';,. \n\t\$'
 report_path = '/Cow_Sales/CS_PastSales.html'
 
@@ -77,22 +76,6 @@ def get_sale_date(this_report):
     return sale_date
 
 
-def is_number(string):
-    """Test whether a string is number-ish. Ignoring units like 'cwt' and 'hd'."""
-
-    if string:
-        string = re.sub(r'\$|[,-/]|cwt|he?a?d?', '', string, flags = re.IGNORECASE)
-        try:
-            float(string)
-            result = True
-        except ValueError:
-            result = False
-    else:
-        result = False
-
-    return result
-
-
 def get_sale(word):
 
     match = re.search(r'([0-9]+)\s+[^0-9]', word[2])
@@ -135,6 +118,8 @@ def get_sale(word):
 
 def main():
 
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
     # get URLs for historical reports
     request = Request(
         base_url + report_path,
@@ -8,7 +8,6 @@ from datetime import date
 import scrape_util
  
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 report_path = 'marketcards.htm'
 strip_char = ';,. \n\t'
 
@@ -135,6 +134,8 @@ def write_sale(lines, this_default_sale, writer):
 
 def main():            
     
+    default_sale, base_url, prefix = scrape_util.get_market(argv)
+
     # Get URLs for all reports
     request = Request(
         base_url + report_path,
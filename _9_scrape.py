@@ -8,7 +8,6 @@ from dateutil import parser
 import scrape_util
 
 
-default_sale, base_url, prefix = scrape_util.get_market(argv)
 strip_char = ';,. \n\t'
 report_path = '/index.cfm'
 
@@ -98,6 +97,8 @@ def get_sale(word):
 
 def main():
 
+   default_sale, base_url, prefix = scrape_util.get_market(argv)
+
    # get URLs for all reports
    request = Request(
        base_url + report_path,
@@ -6,21 +6,11 @@ cd `dirname $0`
 arx=dbased.tar.gz
 
 echo '  START SCRAPE'
-py=$(ls *_scrape.py)
-for this_py in $py; do
-  env/bin/python $this_py
-  if [[ $? != 0 ]]; then
-    echo "    CLEANUP from $this_py"
-    id=$(echo $this_py | cut -d '_' -f 2)
-    prefix=$(mysql -N -D cownet -e "select script from roundup_website where roundup_website_id = $id")
-    mkdir -p ${prefix}_scrape/cleanup
-    mv ${prefix}_scrape/*.csv ${prefix}_scrape/cleanup/
-  fi
-done
+env/bin/python scrape_run.py --jobs 8
 echo '  END SCRAPE'
 
 echo '  START ARCHIVE'
-tar -czf $arx *_scrape/
+tar -czf $arx --exclude='temp_*' *_scrape/
 gpg2 --no-tty -e -r itc2@georgetown.edu $arx
 rm $arx
 mv $arx.gpg ~/"Dropbox (Bansal Lab)"/Ian_Bansal_Lab/cownet/data/
@@ -0,0 +1,140 @@
+import numpy as np
+
+
+def box_array(word):
+    """Return the bounding boxes of a sequence of Word tuples as an n x 4
+    array of x_min, y_min, x_max, y_max.
+    """
+
+    return np.array([this_word[:4] for this_word in word], dtype=float).reshape(-1, 4)
+
+
+def row_tolerance(box):
+    """Return the default vertical jump that starts a new row, half the
+    median height of a word.
+    """
+
+    return np.median(box[:, 3] - box[:, 1]) / 2 if len(box) else 0.0
+
+
+def cell_gap(word, box):
+    """Return the default horizontal gap that separates cells, twice the
+    median character width, the bounding box analog of splitting on \\s{2,}.
+    """
+
+    length = np.array([len(this_word.text) for this_word in word], dtype=float)
+    is_text = length > 0
+    if not is_text.any():
+        return 0.0
+    width = (box[is_text, 2] - box[is_text, 0]) / length[is_text]
+
+    return 2 * np.median(width)
+
+
+def row_label(box, tolerance):
+    """Return the row of each box, numbered top to bottom. A new row starts
+    where the vertical center of the next box jumps by more than tolerance.
+    """
+
+    center = (box[:, 1] + box[:, 3]) / 2
+    order = np.argsort(center, kind='stable')
+    label = np.empty(len(box), dtype=int)
+    label[order] = np.concatenate([[0], np.cumsum(np.diff(center[order]) > tolerance)])
+
+    return label
+
+
+def layout(word, gap=None, tolerance=None):
+    """Return the boxes, the reading order (rows top to bottom, each left to
+    right), the row label and the segment label of each word, where a new
+    segment starts at each row and wherever the space between words exceeds
+    gap.
+    """
+
+    box = box_array(word)
+    if gap is None:
+        gap = cell_gap(word, box)
+    if tolerance is None:
+        tolerance = row_tolerance(box)
+
+    label = row_label(box, tolerance)
+    order = np.lexsort((box[:, 0], label))
+    ordered_label = label[order]
+    is_start = np.ones(len(box), dtype=bool)
+    is_start[1:] = (
+        (ordered_label[1:] != ordered_label[:-1])
+        | (box[order[1:], 0] - box[order[:-1], 2] > gap)
+        )
+    segment = np.empty(len(box), dtype=int)
+    segment[order] = np.cumsum(is_start) - 1
+
+    return box, order, label, segment
+
+
+def segments(word, gap=None, tolerance=None):
+    """Return the rows of a page, top to bottom, as lists of segment text,
+    left to right, joining the words of a segment with a space.
+    """
+
+    box, order, label, segment = layout(word, gap, tolerance)
+    row = []
+    last_label = last_segment = None
+    for idx in order:
+        if label[idx] != last_label:
+            row.append([])
+        if segment[idx] != last_segment:
+            row[-1].append([])
+        row[-1][-1].append(word[idx].text)
+        last_label, last_segment = label[idx], segment[idx]
+
+    return [[' '.join(text) for text in this_row] for this_row in row]
+
+
+def columns(word, gap=None, tolerance=None):
+    """Return the x positions that separate the columns of a page.
+
+    The segments of every row split in two or more are projected onto the
+    x axis; the boundaries are the midpoints of the gaps left uncovered,
+    so one-cell rows like titles and headers do not close a column gap.
+    """
+
+    box, order, label, segment = layout(word, gap, tolerance)
+    if not len(box):
+        return []
+    start = np.flatnonzero(np.diff(np.concatenate([[-1], segment[order]])))
+    span_min = np.minimum.reduceat(box[order, 0], start)
+    span_max = np.maximum.reduceat(box[order, 2], start)
+    span_row = label[order][start]
+    is_split = np.bincount(span_row)[span_row] > 1
+    span_min, span_max = span_min[is_split], span_max[is_split]
+
+    span_order = np.argsort(span_min, kind='stable')
+    span_min, span_max = span_min[span_order], span_max[span_order]
+    right = np.maximum.accumulate(span_max)[:-1]
+    is_gap = span_min[1:] > right
+
+    return ((right[is_gap] + span_min[1:][is_gap]) / 2).tolist()
+
+
+def table(word, column=None, gap=None, tolerance=None):
+    """Return the rows of a page as tuples of cell text, with one cell per
+    column and '' where a row has nothing in a column.
+
+    Column boundaries (x positions) are derived from the page unless given,
+    e.g. to hold them fixed across the pages of a report.
+    """
+
+    box, order, label, segment = layout(word, gap, tolerance)
+    if column is None:
+        column = columns(word, gap, tolerance)
+    cell = np.searchsorted(column, (box[:, 0] + box[:, 2]) / 2, side='right')
+
+    row = []
+    last_label = None
+    for idx in order:
+        if label[idx] != last_label:
+            row.append([[] for this_column in range(len(column) + 1)])
+            last_label = label[idx]
+        row[-1][cell[idx]].append(word[idx].text)
+
+    return [tuple(' '.join(text) for text in this_row) for this_row in row]
@@ -0,0 +1,196 @@
+import subprocess
+import importlib.util
+import traceback
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import redirect_stdout, redirect_stderr
+from argparse import ArgumentParser
+from io import StringIO
+from pathlib import Path
+from time import perf_counter
+import sys
+import scrape_util
+
+
+def cleanup(script):
+    """Move CSV files written by a failed script out of the way."""
+
+    market, url, prefix = scrape_util.get_market([str(script)])
+    folder = script.parent / Path(prefix + '_scrape')
+    cleanup = folder / Path('cleanup')
+    cleanup.mkdir(parents=True, exist_ok=True)
+    for this_csv in folder.glob('*.csv'):
+        this_csv.replace(cleanup / this_csv.name)
+
+
+def run_script(script):
+    """Run one scraper in its own interpreter, returning the exit code,
+    the wall time in seconds and the combined output.
+    """
+
+    start = perf_counter()
+    result = subprocess.run(
+        [sys.executable, script.name],
+        cwd=str(script.parent),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        )
+    elapsed = perf_counter() - start
+    output = result.stdout.decode(scrape_util.coding, 'replace')
+    if result.returncode != 0:
+        output += clean_failure(script)
+
+    return result.returncode, elapsed, output
+
+
+def load_scraper(script):
+    """Import a scraper as a plugin module without executing its main()."""
+
+    spec = importlib.util.spec_from_file_location(script.stem, str(script))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    return module
+
+
+def run_plugin(script):
+    """Run one scraper inside this long-lived worker process, returning the
+    exit code, the wall time in seconds and the combined output.
+
+    The market is resolved here and injected through scrape_util.context,
+    so the scraper never reads argv[0] and the imports and database engine
+    of the worker are reused by every scraper it runs.
+    """
+
+    start = perf_counter()
+    output = StringIO()
+    with redirect_stdout(output), redirect_stderr(output):
+        try:
+            market, url, prefix = scrape_util.get_market([str(script)])
+            scrape_util.context = {
+                'script': script,
+                'market': market,
+                'url': url,
+                'prefix': prefix,
+                }
+            load_scraper(script).main()
+            exit_code = 0
+        except SystemExit as error:
+            if error.code is None or isinstance(error.code, int):
+                exit_code = error.code or 0
+            else:
+                print(error.code)
+                exit_code = 1
+        except Exception:
+            traceback.print_exc()
+            exit_code = 1
+        finally:
+            scrape_util.context = None
+    elapsed = perf_counter() - start
+    output = output.getvalue()
+    if exit_code != 0:
+        output += clean_failure(script)
+
+    return exit_code, elapsed, output
+
+
+def clean_failure(script):
+    """Clean up after a failed script, returning a message for the log."""
+
+    message = '    CLEANUP from {}\n'.format(script.name)
+    try:
+        cleanup(script)
+    except Exception as error:
+        message += '    Failure cleanup in {}: {}\n'.format(script.name, error)
+
+    return message
+
+
+def collect(future, summary):
+    """Print the output of each script as it finishes and record its exit
+    code and wall time in summary, returning the scripts lost with a broken
+    process pool.
+    """
+
+    retry = []
+    for this_future in as_completed(future):
+        this_script = future[this_future]
+        try:
+            exit_code, elapsed, output = this_future.result()
+        except BrokenProcessPool:
+            # A scraper took its worker down, failing every unfinished script
+            retry.append(this_script)
+            continue
+        except Exception:
+            exit_code, elapsed = 1, 0.0
+            output = traceback.format_exc() + clean_failure(this_script)
+        summary[this_script.name] = (exit_code, elapsed)
+        if output:
+            print('    OUTPUT from {}'.format(this_script.name))
+            print(output, end='', flush=True)
+
+    return retry
+
+
+def script_order(name):
+    """Sort key for script names, by roundup website id and then by name,
+    with names that carry no id last.
+    """
+
+    website_id = name.split('_')[1] if name.count('_') > 1 else ''
+    if website_id.isdigit():
+        return 0, int(website_id), name
+
+    return 1, 0, name
+
+
+def main():
+
+    parser = ArgumentParser(description='Run every *_scrape.py script in a bounded pool of workers.')
+    parser.add_argument('-j', '--jobs', type=int, default=8, help='number of scripts to run at once')
+    parser.add_argument(
+        '--isolated', action='store_true',
+        help='start a new interpreter for each script instead of importing it into a worker',
+        )
+    parser.add_argument('script', nargs='*', help='scripts to run, default all *_scrape.py')
+    args = parser.parse_args()
+
+    folder = Path(__file__).resolve().parent
+    if args.script:
+        script = [Path(this_script).resolve() for this_script in args.script]
+    else:
+        script = sorted(folder.glob('*_scrape.py'))
+
+    # Refresh the market cache once, before any script reads it
+    scrape_util.read_markets()
+
+    # Run scripts concurrently, printing output as each one finishes
+    summary = {}
+    start = perf_counter()
+    if args.isolated:
+        executor, run = ThreadPoolExecutor(max_workers=args.jobs), run_script
+    else:
+        executor, run = ProcessPoolExecutor(max_workers=args.jobs), run_plugin
+    with executor:
+        future = {executor.submit(run, this_script): this_script for this_script in script}
+        retry = collect(future, summary)
+
+    # Rerun scripts lost with a broken pool, each in its own interpreter, so
+    # the one that crashed fails (and is cleaned up) alone
+    if retry:
+        with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+            future = {executor.submit(run_script, this_script): this_script for this_script in retry}
+            collect(future, summary)
+    elapsed = perf_counter() - start
+
+    # Report the wall time and exit code of each script
+    print('    {:<24}{:>6}{:>10}'.format('script', 'exit', 'seconds'))
+    for name in sorted(summary, key=script_order):
+        exit_code, this_elapsed = summary[name]
+        print('    {:<24}{:>6}{:>10.1f}'.format(name, exit_code, this_elapsed))
+    failed = sum(1 for exit_code, this_elapsed in summary.values() if exit_code != 0)
+    print('    {} scripts, {} failed, {:.1f} seconds'.format(len(summary), failed, elapsed))
+
+
+if __name__ == '__main__':
+    main()
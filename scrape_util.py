@@ -1,15 +1,55 @@
 import re
+import csv
+import json
+import codecs
+import subprocess
 import hashlib
+from copy import deepcopy
+from functools import lru_cache
+from collections import namedtuple
+from time import time
+from datetime import datetime, date
 from pathlib import Path
+from urllib.parse import urljoin
 from sys import platform
+from os import getpid, cpu_count, environ
 from os.path import expanduser
+from shutil import rmtree
+from tempfile import mkdtemp, TemporaryDirectory
+from concurrent.futures import ThreadPoolExecutor
+from weakref import finalize
+from multiprocessing.util import Finalize
+from xml.etree import ElementTree
+import dateutil.parser
+import requests
+from requests.adapters import HTTPAdapter
 from sqlalchemy import create_engine
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import sessionmaker
 
 
-def get_market(argv):
+# Market of the scraper executing in-process, as set by scrape_run
+context = None
+
+# Local copy of the market metadata for all roundup websites
+market_cache = Path(expanduser('~')) / Path('.roundup_market.json')
+market_ttl = 24 * 60 * 60
+markets = None
+
+
+def script_folder(argv):
+    """Return the folder holding the running scraper."""
+
+    if context:
+        return context['script'].parent
+    return Path(argv[0]).parent
+
+
+def load_markets():
+    """Query the database once for the market, url and prefix of every
+    roundup website, keyed by roundup_website_id.
+    """
 
-    roundup_website_id = Path(argv[0]).stem.split('_')[1]
     connect_args = {
         'option_files': expanduser('~') + '/.my.cnf',
         'option_groups': ['client', 'roundup-db'],
@@ -22,30 +62,86 @@ def get_market(argv):
     Session = sessionmaker(bind=engine)
     session = Session()
     result = session.execute(
-        "SELECT address.* "
-        "FROM roundup_market "
-        "JOIN address using(address_id) "
-        "WHERE roundup_website_id = {} "
-        "ORDER BY address.city".format(roundup_website_id)
+        "SELECT roundup_website_id AS roundup_id, "
+        "website AS roundup_website, script AS roundup_script, address.* "
+        "FROM roundup_website "
+        "LEFT JOIN roundup_market USING(roundup_website_id) "
+        "LEFT JOIN address USING(address_id) "
+        "ORDER BY roundup_website_id, address.city"
         ).fetchall()
-    market = []
+    session.close()
+    engine.dispose()
+
+    website = {}
     for this_result in result:
+        roundup_website_id = str(this_result['roundup_id'])
+        if roundup_website_id not in website:
+            website[roundup_website_id] = {
+                'market': [],
+                'url': 'http://' + this_result['roundup_website'] + '/',
+                'prefix': this_result['roundup_script'],
+                }
+        if this_result['address_id'] is None:
+            continue
         this_result = {'sale_' + k: v for k, v in this_result.items() if v}
-        market.append({k: v for k, v in this_result.items() if k in header})
-    if len(market) == 1:
-        market = market[0]
-    elif len(market) == 0:
-        market = {}
-    website = session.execute(
-        "SELECT website, script "
-        "FROM roundup_website "
-        "WHERE roundup_website_id = {}".format(roundup_website_id)
-        ).first()
-    url = 'http://' + website['website'] + '/'
-    prefix = website['script']
-    session.close()
+        website[roundup_website_id]['market'].append(
+            {k: v for k, v in this_result.items() if k in header}
+            )
+    for this_website in website.values():
+        if len(this_website['market']) == 1:
+            this_website['market'] = this_website['market'][0]
+        elif len(this_website['market']) == 0:
+            this_website['market'] = {}
+
+    return website
+
+
+def read_markets(refresh=False):
+    """Return the metadata of every roundup website from the local cache,
+    reloading it from the database when older than market_ttl seconds.
+    The stale cache is used when the database is unreachable.
+    """
+
+    global markets
+    if markets and not refresh:
+        return markets
+
+    is_fresh = (
+        market_cache.exists()
+        and time() - market_cache.stat().st_mtime < market_ttl
+        )
+    if refresh or not is_fresh:
+        try:
+            website = load_markets()
+        except SQLAlchemyError:
+            if not market_cache.exists():
+                raise
+            print('Failure loading markets, using cache {}.'.format(market_cache))
+        else:
+            temp_cache = market_cache.with_suffix('.{}.tmp'.format(getpid()))
+            with temp_cache.open('w', encoding=coding) as io:
+                json.dump(website, io, default=str)
+            temp_cache.replace(market_cache)
+    with market_cache.open('r', encoding=coding) as io:
+        markets = json.load(io)
 
-    return market, url, prefix
+    return markets
+
+
+def get_market(argv):
+
+    if context:
+        return deepcopy(context['market']), context['url'], context['prefix']
+
+    roundup_website_id = Path(argv[0]).stem.split('_')[1]
+    website = read_markets()
+
+    # A website added since the cache was written is only in the database
+    if roundup_website_id not in website:
+        website = read_markets(refresh=True)
+    website = website[roundup_website_id]
+
+    return deepcopy(website['market']), website['url'], website['prefix']
 
 
 def phantom():
@@ -62,6 +158,270 @@ def phantom():
 
 url_header = {'user-agent': 'livestock-market-research-bot/1.0 (itc2@georgetown.edu)'}
 
+# Seconds to wait for a connection, and then for each read, from a web server
+url_timeout = (15, 120)
+
+# HTTP session shared by every scraper in a process
+session = None
+
+
+def http_session():
+    """Return the shared HTTP session, which keeps connections alive in a
+    pool per host and sends url_header with every request.
+    """
+
+    global session
+    if not session:
+        session = requests.Session()
+        session.headers.update(url_header)
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=4)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+    return session
+
+
+def http_get(url, **kwargs):
+    """GET a url over the shared session, applying url_timeout."""
+
+    kwargs.setdefault('timeout', url_timeout)
+    return http_session().get(url, **kwargs)
+
+
+def http_post(url, **kwargs):
+    """POST to a url over the shared session, applying url_timeout."""
+
+    kwargs.setdefault('timeout', url_timeout)
+    return http_session().post(url, **kwargs)
+
+
+# Simple CSS selector (tag, #id and .class, each optional) of the container
+# that fetch_links parses
+simple_selector = re.compile(r'(?P<name>[\w-]*)(?:#(?P<id>[\w-]+))?(?:\.(?P<class>[\w-]+))?')
+
+
+def selector_strainer(selector):
+    """Return the tag name and attributes matched by a simple CSS selector,
+    e.g. 'div#content' or 'div.module', as find() and SoupStrainer take them.
+    """
+
+    match = simple_selector.fullmatch(selector)
+    if not match or not any(match.groups()):
+        raise ValueError('unsupported container selector {!r}'.format(selector))
+    attrs = {}
+    if match.group('id'):
+        attrs['id'] = match.group('id')
+    if match.group('class'):
+        # One of several classes; a SoupStrainer sees the attribute unsplit
+        attrs['class'] = re.compile(r'(?:^|\s){}(?:\s|$)'.format(re.escape(match.group('class'))))
+
+    return match.group('name') or None, attrs
+
+
+def fetch_links(url, container_selector=None, href_filter=None, listing=None, **kwargs):
+    """Return the (text, href) of each link in the first element matching
+    container_selector on the page at url, or of every link on the page,
+    keeping those href_filter (a pattern searched in the href, or a function
+    of it) accepts. Only the container is parsed, through a SoupStrainer,
+    so the rest of a heavy page never becomes a tree.
+
+    Pass a ListingCache as listing to GET the page through it, returning
+    None when the page is unchanged since the last run.
+    """
+
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    if listing:
+        response = listing.get(url, **kwargs)
+        if not response:
+            return None
+    else:
+        response = http_get(url, **kwargs)
+        response.raise_for_status()
+
+    if container_selector:
+        name, attrs = selector_strainer(container_selector)
+        soup = BeautifulSoup(response.content, 'lxml', parse_only=SoupStrainer(name, attrs))
+        container = soup.find(name, attrs)
+        if not container:
+            return []
+    else:
+        container = BeautifulSoup(response.content, 'lxml', parse_only=SoupStrainer('a', href=True))
+
+    link = [(this_link.get_text(' ', strip=True), this_link['href']) for this_link in container.find_all('a', href=True)]
+    if href_filter is None:
+        return link
+    if callable(href_filter):
+        return [(text, href) for text, href in link if href_filter(href)]
+
+    return [(text, href) for text, href in link if href_filter.search(href)]
+
+
+def selector_xpath(selector):
+    """Return the XPath matching a simple CSS selector anywhere in a page."""
+
+    match = simple_selector.fullmatch(selector)
+    if not match or not any(match.groups()):
+        raise ValueError('unsupported selector {!r}'.format(selector))
+    xpath = '//' + (match.group('name') or '*')
+    if match.group('id'):
+        xpath += '[@id="{}"]'.format(match.group('id'))
+    if match.group('class'):
+        xpath += '[contains(concat(" ", normalize-space(@class), " "), " {} ")]'.format(match.group('class'))
+
+    return xpath
+
+
+def html_document(html):
+    """Parse an HTML page (bytes or text) with lxml, returning its root
+    element, or None for an empty page. The encoding of bytes is detected
+    as BeautifulSoup would, as lxml alone reads undeclared bytes as latin-1.
+    """
+
+    from bs4 import UnicodeDammit
+    from lxml import etree
+
+    if not html:
+        return None
+    if isinstance(html, bytes):
+        encoding = UnicodeDammit(html, is_html=True).original_encoding
+    else:
+        html, encoding = html.encode('utf-8'), 'utf-8'
+
+    return etree.fromstring(html, etree.HTMLParser(encoding=encoding))
+
+
+def html_table_rows(html, selector='table', cell=('td', 'th'), normalize=True, colspan=False):
+    """Yield the rows of the first element matching a simple CSS selector
+    in an HTML page (bytes, text or a document from html_document), or
+    every row on the page with selector=None, as tuples of the text of
+    their cell tags.
+
+    Like find_all('td') on a row, cells of tables nested in a row count as
+    cells of that row too. With normalize, no-break spaces and runs of
+    whitespace in a cell become one space; without it the text is as
+    get_text() would give it. With colspan, a cell spanning columns is
+    followed by '' for each extra column it covers.
+    """
+
+    from lxml import etree
+
+    if isinstance(html, (bytes, str)):
+        html = html_document(html)
+    if html is None:
+        return
+    if selector:
+        table = html.xpath(selector_xpath(selector))
+        if not table:
+            return
+        row = table[0].iter('tr')
+    else:
+        row = html.iter('tr')
+
+    # Walk the cells of a row directly, as an XPath per row costs more
+    cell_string = etree.XPath('string()')
+    for this_row in row:
+        text = []
+        for this_cell in this_row.iter(*cell):
+            if normalize:
+                text.append(' '.join(cell_string(this_cell).split()))
+            else:
+                text.append(cell_string(this_cell))
+            span = this_cell.get('colspan', '').strip()
+            if colspan and span.isdigit() and int(span) > 1:
+                text.extend([''] * (int(span) - 1))
+        yield tuple(text)
+
+
+# Headless browser shared by every scraper in a process
+browser = None
+
+# Seconds to wait for a JavaScript-rendered page to show what a scraper needs
+browser_timeout = 30
+
+# Script returning [left, top, right, bottom, text] for each rendered line
+# of the text nodes inside the elements matching a CSS selector, in page
+# coordinates. The words of a node are measured one by one, so a node that
+# wraps over several lines gives one box per line.
+text_node_script = '''
+var text = [];
+var range = document.createRange();
+var word = /\\S+/g;
+var root = document.querySelectorAll(arguments[0]);
+for (var i = 0; i < root.length; i++) {
+    var walker = document.createTreeWalker(root[i], NodeFilter.SHOW_TEXT, null, false);
+    while (walker.nextNode()) {
+        var node = walker.currentNode;
+        var line = null;
+        var match;
+        word.lastIndex = 0;
+        while ((match = word.exec(node.nodeValue)) !== null) {
+            range.setStart(node, match.index);
+            range.setEnd(node, match.index + match[0].length);
+            var rect = range.getBoundingClientRect();
+            if (!rect.width && !rect.height) {
+                continue;
+            }
+            var left = rect.left + window.pageXOffset;
+            var top = rect.top + window.pageYOffset;
+            var right = rect.right + window.pageXOffset;
+            var bottom = rect.bottom + window.pageYOffset;
+            if (line && top < line[3] && left >= line[2] - 1) {
+                line[2] = Math.max(line[2], right);
+                line[3] = Math.max(line[3], bottom);
+                line[4] += ' ' + match[0];
+            } else {
+                line = [left, top, right, bottom, match[0]];
+                text.push(line);
+            }
+        }
+    }
+}
+return text;
+'''
+
+
+def web_browser():
+    """Return the shared headless browser, started on first use and quit
+    when the process exits, so a scrape_run worker starts it only once.
+    """
+
+    global browser
+    if not browser:
+        browser = phantom()
+        browser.set_page_load_timeout(url_timeout[1])
+        Finalize(browser, browser.quit, exitpriority=10)
+
+    return browser
+
+
+def browser_get(url, selector, timeout=None):
+    """Load a url in the shared browser and wait, up to timeout seconds,
+    until an element matching the CSS selector is present, returning the
+    browser. Raises selenium's TimeoutException if it never appears.
+    """
+
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    this_browser = web_browser()
+    this_browser.get(url)
+    WebDriverWait(this_browser, timeout or browser_timeout).until(
+        expected_conditions.presence_of_element_located((By.CSS_SELECTOR, selector))
+        )
+
+    return this_browser
+
+
+def browser_text(selector):
+    """Return a Word for every rendered line of text inside the elements
+    matching the CSS selector on the current page, from one script
+    evaluation.
+    """
+
+    return [Word(*item) for item in web_browser().execute_script(text_node_script, selector)]
+
 coding = 'utf-8'
 
 header = [
@@ -95,74 +455,528 @@ header = [
 
 default_cattle_clue = r'(bulls?|steers?|strs?|cows?|heifers?|hfrs?|calf|calves|pairs?)$'
 
-state = '|'.join([
-    r'\bAB\b', r'\bAlberta\b',
-    r'\bAL\b', r'\bAlabama\b',
-    r'\bAK\b', r'\bAlaska\b',
-    r'\bAZ\b', r'\bArizona\b',
-    r'\bAR\b', r'\bArkansas\b',
-    r'\bCA\b', r'\bCalifornia\b',
-    r'\bCO\b', r'\bColorado\b',
-    r'\bCT\b', r'\bConnecticut\b',
-    r'\bDE\b', r'\bDelaware\b',
-    r'\bDC\b',
-    r'\bFL\b', r'\bFlorida\b',
-    r'\bGA\b', r'\bGeorgia\b',
-    r'\bHI\b', r'\bHawaii\b',
-    r'\bID\b', r'\bIdaho\b',
-    r'\bIL\b', r'\bIllinois\b', r'\bIll\b',
-    r'\bIN\b', r'\bIndiana\b',
-    r'\bIA\b', r'\bIowa\b',
-    r'\bKS\b', r'\bKansas\b',
-    r'\bKY\b', r'\bKentucky\b',
-    r'\bLA\b', r'\bLouisiana\b',
-    r'\bME\b', r'\bMaine\b',
-    r'\bMD\b', r'\bMaryland\b',
-    r'\bMA\b', r'\bMassachusetts\b',
-    r'\bMI\b', r'\bMichigan\b', r'\bMich\b',
-    r'\bMN\b', r'\bMinnesota\b', r'\bMinn\b',
-    r'\bMS\b', r'\bMississippi\b', r'\bMiss\b',
-    r'\bMO\b', r'\bMissouri\b',
-    r'\bMT\b', r'\bMontana\b', r'\bMont\b',
-    r'\bNE\b', r'\bNebraska\b', r'\bNeb\b',
-    r'\bNV\b', r'\bNevada\b',
-    r'\bNH\b', r'\bNew Hampshire\b',
-    r'\bNJ\b', r'\bNew Jersey\b',
-    r'\bNM\b', r'\bNew Mexico\b',
-    r'\bNY\b', r'\bNew York\b',
-    r'\bNC\b', r'\bNorth Carolina\b',
-    r'\bND\b', r'\bNorth Dakota\b', r'\bN.D\b',
-    r'\bOH\b', r'\bOhio\b',
-    r'\bOK\b', r'\bOklahoma\b', r'\bOkla\b',
-    r'\bOR\b', r'\bOregon\b',
-    r'\bPA\b', r'\bPennsylvania\b',
-    r'\bRI\b', r'\bRhode Island\b',
-    r'\bSC\b', r'\bSouth Carolina\b',
-    r'\bSD\b', r'\bSouth Dakota\b', r'\bS.D\b',
-    r'\bSK\b', r'\bSaskatchewan\b',
-    r'\bTN\b', r'\bTennessee\b',
-    r'\bTX\b', r'\bTexas\b',
-    r'\bUT\b', r'\bUtah\b',
-    r'\bVT\b', r'\bVermont\b',
-    r'\bVA\b', r'\bVirginia\b',
-    r'\bWA\b', r'\bWashington\b',
-    r'\bWV\b', r'\bWest Virginia\b',
-    r'\bWI\b', r'\bWisonsin\b',
-    r'\bWY\b', r'\bWyoming\b', r'\bWyo\b',
-    ])
+# Two-letter state and province codes, each with the names and abbreviations
+# recognized after it, where '.' in a name stands for any one character
+state_name = [
+    ('AB', ['Alberta']),
+    ('AL', ['Alabama']),
+    ('AK', ['Alaska']),
+    ('AZ', ['Arizona']),
+    ('AR', ['Arkansas']),
+    ('CA', ['California']),
+    ('CO', ['Colorado']),
+    ('CT', ['Connecticut']),
+    ('DE', ['Delaware']),
+    ('DC', []),
+    ('FL', ['Florida']),
+    ('GA', ['Georgia']),
+    ('HI', ['Hawaii']),
+    ('ID', ['Idaho']),
+    ('IL', ['Illinois', 'Ill']),
+    ('IN', ['Indiana']),
+    ('IA', ['Iowa']),
+    ('KS', ['Kansas']),
+    ('KY', ['Kentucky']),
+    ('LA', ['Louisiana']),
+    ('ME', ['Maine']),
+    ('MD', ['Maryland']),
+    ('MA', ['Massachusetts']),
+    ('MI', ['Michigan', 'Mich']),
+    ('MN', ['Minnesota', 'Minn']),
+    ('MS', ['Mississippi', 'Miss']),
+    ('MO', ['Missouri']),
+    ('MT', ['Montana', 'Mont']),
+    ('NE', ['Nebraska', 'Neb']),
+    ('NV', ['Nevada']),
+    ('NH', ['New Hampshire']),
+    ('NJ', ['New Jersey']),
+    ('NM', ['New Mexico']),
+    ('NY', ['New York']),
+    ('NC', ['North Carolina']),
+    ('ND', ['North Dakota', 'N.D']),
+    ('OH', ['Ohio']),
+    ('OK', ['Oklahoma', 'Okla']),
+    ('OR', ['Oregon']),
+    ('PA', ['Pennsylvania']),
+    ('RI', ['Rhode Island']),
+    ('SC', ['South Carolina']),
+    ('SD', ['South Dakota', 'S.D']),
+    ('SK', ['Saskatchewan']),
+    ('TN', ['Tennessee']),
+    ('TX', ['Texas']),
+    ('UT', ['Utah']),
+    ('VT', ['Vermont']),
+    ('VA', ['Virginia']),
+    ('WA', ['Washington']),
+    ('WV', ['West Virginia']),
+    ('WI', ['Wisonsin']),
+    ('WY', ['Wyoming', 'Wyo']),
+    ]
+
+state = '|'.join(r'\b{}\b'.format(name) for code, name in state_name for name in [code] + name)
+
+# Lookup from the lower case letters of each one word (first) and two word
+# (second) entry in state_name to its code, its letters as written and the
+# separator between its words
+state_lookup = ({}, {})
+for code, name in state_name:
+    for this_name in [code] + name:
+        part = re.split(r'([ .])', this_name)
+        letters = ''.join(part[::2])
+        state_lookup[len(part) // 2][letters.lower()] = (code, letters, ''.join(part[1::2]))
+state_suffix = re.compile(r'(.*?)(?:\b(\w+)(\W))?\b(\w+)', re.DOTALL)
+non_word = re.compile(r'\W+')
+
+
+def state_code(name, ignore_case=True):
+    """Return the two-letter code for the name of a state or province,
+    e.g. 'NE' for 'Neb.' or 'nebraska', or None if it is not one.
+    """
+
+    part = [this_part for this_part in non_word.split(name) if this_part]
+    if not 0 < len(part) < 3:
+        return None
+    letters = ''.join(part)
+    code, canonical, separator = state_lookup[len(part) - 1].get(letters.lower(), (None, None, None))
+    if code and (ignore_case or letters == canonical):
+        return code
+
+    return None
+
+
+def split_state(text, ignore_case=False):
+    """Split a state or province off the end of text, returning the text
+    before it and the state as written, or None if text does not end in
+    one. Equivalent to re.fullmatch('(.*?)(' + state + ')', text), but with
+    a dictionary lookup of the last one or two words.
+    """
+
+    match = state_suffix.fullmatch(text)
+    if not match:
+        return None
+    if match.group(2):
+        letters = match.group(2) + match.group(4)
+        code, canonical, separator = state_lookup[1].get(letters.lower(), (None, None, None))
+        is_state = (
+            code
+            and (ignore_case or letters == canonical)
+            and (separator == '.' or separator == match.group(3))
+            )
+        if is_state:
+            return match.group(1), text[match.start(2):]
+    letters = match.group(4)
+    code, canonical, separator = state_lookup[0].get(letters.lower(), (None, None, None))
+    if code and (ignore_case or letters == canonical):
+        return text[:match.start(4)], letters
+
+    return None
 
 if platform=='darwin':
     pdftotext = '/usr/local/bin/pdftotext -enc UTF-8 -q -table {}'
+    pdftotext_args = ['/usr/local/bin/pdftotext', '-enc', 'UTF-8', '-q', '-table']
+    pdftotext_bbox_args = ['/usr/local/bin/pdftotext', '-enc', 'UTF-8', '-q', '-bbox']
+    pdfinfo_args = ['/usr/local/bin/pdfinfo']
     gocr = '/usr/local/bin/gocr {} > {}'
     convert = '/usr/local/bin/convert {} {} {}'
+    convert_args = ['/usr/local/bin/convert']
     tesseract = '/usr/local/bin/tesseract -psm 6 {} {} {}'
+    tesseract_args = ['/usr/local/bin/tesseract', '-psm', '6']
 elif platform=='linux':
     pdftotext = '/usr/local/bin/pdftotext -enc UTF-8 -q -table {}'
+    pdftotext_args = ['/usr/local/bin/pdftotext', '-enc', 'UTF-8', '-q', '-table']
+    pdftotext_bbox_args = ['/usr/local/bin/pdftotext', '-enc', 'UTF-8', '-q', '-bbox']
+    pdfinfo_args = ['/usr/local/bin/pdfinfo']
     gocr = '/usr/bin/gocr {} > {}'
     convert = '/usr/bin/convert {} {} {}'
+    convert_args = ['/usr/bin/convert']
     tesseract = '/usr/bin/tesseract -psm 6 {} {} {}'
+    tesseract_args = ['/usr/bin/tesseract', '-psm', '6']
 elif platform=='win32':
     pdftotext = '"C:\Program Files\Xpdf\pdftotext.exe" -q -table {}'
+    pdftotext_args = ['C:\\Program Files\\Xpdf\\pdftotext.exe', '-enc', 'UTF-8', '-q', '-table']
+    # Xpdf has no -bbox mode, so words come from poppler's pdftotext, and
+    # OCR uses ImageMagick 7 and Tesseract, all found on the PATH
+    pdftotext_bbox_args = ['pdftotext', '-enc', 'UTF-8', '-q', '-bbox']
+    pdfinfo_args = ['C:\\Program Files\\Xpdf\\pdfinfo.exe']
+    convert_args = ['magick', 'convert']
+    tesseract_args = ['tesseract', '-psm', '6']
+
+
+# Common ways of writing a sale date, tried before dateutil as (pattern,
+# function of the match returning year, month and day). Numeric dates
+# are month first like dateutil, except in the <prefix>_yy-mm-dd.csv name
+# of an archived CSV file, which must be the whole name to be read year
+# first, so links like Sale_12-05-15.pdf stay month first.
+month_number = {
+    name: idx + 1 for idx, this_month in enumerate([
+        ['jan', 'january'], ['feb', 'february'], ['mar', 'march'], ['apr', 'april'],
+        ['may'], ['jun', 'june'], ['jul', 'july'], ['aug', 'august'],
+        ['sep', 'sept', 'september'], ['oct', 'october'], ['nov', 'november'], ['dec', 'december'],
+        ]) for name in this_month
+    }
+month = '|'.join(sorted(month_number, key=len, reverse=True))
+date_format = [
+    (
+        re.compile(r'(?:^|(?<=[/\\]))[^\W_]+_(\d{2})-(\d{2})-(\d{2})(?:_[0-9a-f]{32})?\.csv$'),
+        lambda match: match.groups(),
+        ),
+    (
+        re.compile(r'(?<!\d)(\d{1,2})([/.-])(\d{1,2})\2(\d{4}|\d{2})(?!\d)'),
+        lambda match: (match.group(4), match.group(1), match.group(3)),
+        ),
+    (
+        re.compile(r'\b({})\.?\s+(\d{{1,2}})(?:st|nd|rd|th)?,?\s+(\d{{4}})(?!\d)'.format(month), re.IGNORECASE),
+        lambda match: (match.group(3), month_number[match.group(1).lower()], match.group(2)),
+        ),
+    (
+        re.compile(r'(?<!\d)(\d{4})-(\d{1,2})-(\d{1,2})(?!\d)'),
+        lambda match: match.groups(),
+        ),
+    ]
+other_date_word = re.compile(r'\d|\b(?:{})\b'.format(month), re.IGNORECASE)
+
+
+def full_year(year):
+    """Return a year, completing two digits to the year within 50 years of
+    today as dateutil does.
+    """
+
+    year = int(year)
+    if year < 100:
+        this_year = date.today().year
+        year += this_year - this_year % 100
+        if abs(year - this_year) >= 50:
+            year += 100 if year < this_year else -100
+
+    return year
+
+
+@lru_cache(maxsize=4096)
+def read_sale_date(date_string, fuzzy):
+    """Return the date written in date_string, from the first format in
+    date_format it contains if nothing else in it looks like part of a date
+    (or if it is nothing but the date, when not fuzzy), else from dateutil.
+    """
+
+    for pattern, part in date_format:
+        match = pattern.search(date_string)
+        if not match:
+            continue
+        if fuzzy:
+            rest = date_string[:match.start()] + ' ' + date_string[match.end():]
+            is_alone = not other_date_word.search(rest)
+        else:
+            is_alone = match.group(0) == date_string.strip()
+        if is_alone:
+            year, month, day = part(match)
+            try:
+                return date(full_year(year), int(month), int(day))
+            except ValueError:
+                pass
+        break
+
+    return dateutil.parser.parse(date_string, fuzzy=fuzzy).date()
+
+
+def parse_sale_date(date_string, fuzzy=True, future=False):
+    """Return the date written in date_string, as read by
+    dateutil.parser.parse, or None if it is after today and future is false.
+    Results are memoized, so repeated dates in a report parse once.
+
+    >>> parse_sale_date('Market_Report_01-05-16.pdf')
+    datetime.date(2016, 1, 5)
+    >>> parse_sale_date('ab_16-01-05.csv')
+    datetime.date(2016, 1, 5)
+    """
+
+    # A str key, so the cache keeps no bs4 NavigableString (and its tree)
+    sale_date = read_sale_date(str(date_string), fuzzy)
+    if not future and sale_date > date.today():
+        return None
+
+    return sale_date
+
+
+def text_to_lines(text):
+    """Split extracted text into lines, without line endings."""
+
+    line = text.split('\n')
+    if not line[-1]:
+        line.pop()
+
+    return line
+
+
+def pdf_to_text(pdf, *option, errors='strict'):
+    """Return the text in a PDF, given as a path or as bytes.
+
+    pdftotext writes to a pipe rather than a side-car .txt file, and a
+    subprocess.CalledProcessError is raised if it fails. Extra options,
+    e.g. '-f', '2', are passed to pdftotext before the file names.
+    """
+
+    if isinstance(pdf, bytes):
+        source, data = '-', pdf
+    else:
+        source, data = str(pdf), None
+    result = subprocess.run(
+        pdftotext_args + list(option) + [source, '-'],
+        input=data,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        check=True,
+        )
+
+    return result.stdout.decode(coding, errors)
+
+
+def pdf_page_text(pdf, *option, errors='strict'):
+    """Return the text of each page in a PDF, from one pdftotext pass
+    split at the form feed that ends every page.
+    """
+
+    page_text = pdf_to_text(pdf, *option, errors=errors).split('\f')
+    if not page_text[-1]:
+        page_text.pop()
+
+    return page_text
+
+
+def pdf_text_layer(pdf):
+    """Return, for each page in a PDF, whether it has extractable text."""
+
+    return [bool(text.strip()) for text in pdf_page_text(pdf, errors='replace')]
+
+
+def pdf_to_lines(pdf, *option, errors='strict', ocr=False, processes=None, **ocr_option):
+    """Return the lines of text in a PDF, given as a path or as bytes.
+
+    With ocr=True, pages without a text layer are read by OCR (see
+    ocr_pages, which gets processes and ocr_option), so born-digital
+    pages never pay for rasterization. A first page given by '-f' is
+    honored, and bytes are written to a temp file for convert to read.
+    """
+
+    if not ocr:
+        return text_to_lines(pdf_to_text(pdf, *option, errors=errors))
+
+    option = list(option)
+    first = int(option[option.index('-f') + 1]) if '-f' in option else 1
+    page_text = pdf_page_text(pdf, *option, errors=errors)
+    blank = [idx for idx, text in enumerate(page_text) if not text.strip()]
+    if blank:
+        page = [first + idx for idx in blank]
+        if isinstance(pdf, bytes):
+            with TemporaryDirectory() as work:
+                path = Path(work) / Path('temp.pdf')
+                path.write_bytes(pdf)
+                ocr_text = ocr_pages(path, page, processes, **ocr_option)
+        else:
+            ocr_text = ocr_pages(pdf, page, processes, **ocr_option)
+        for idx, text in zip(blank, ocr_text):
+            page_text[idx] = text.rstrip('\f')
+
+    return text_to_lines(''.join(text + '\f' for text in page_text))
+
+
+def pdf_pages(pdf, *option, errors='strict'):
+    """Yield the lines of each page of a PDF file in turn.
+
+    A single pdftotext process writes to a pipe that is read as pages are
+    requested, so a caller that stops early (e.g. once the sale date on
+    page one shows the report is archived) leaves the rest unextracted:
+    closing the generator kills the process.
+    """
+
+    process = subprocess.Popen(
+        pdftotext_args + list(option) + [str(pdf), '-'],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        )
+    decoder = codecs.getincrementaldecoder(coding)(errors)
+    try:
+        buffer = ''
+        for chunk in iter(lambda: process.stdout.read1(64 * 1024), b''):
+            buffer += decoder.decode(chunk)
+            *page_text, buffer = buffer.split('\f')
+            for text in page_text:
+                yield text_to_lines(text)
+        buffer += decoder.decode(b'', final=True)
+        if buffer:
+            yield text_to_lines(buffer)
+        if process.wait() != 0:
+            raise subprocess.CalledProcessError(process.returncode, process.args)
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        process.stdout.close()
+
+
+# A word or rendered line of text on a page, with its bounding box from the
+# top left in points (PDF) or pixels (browser), as grouped into rows by
+# scrape_layout
+Word = namedtuple('Word', ['x_min', 'y_min', 'x_max', 'y_max', 'text'])
+
+
+def pdf_to_words(pdf, *option):
+    """Return the words on each page of a PDF file, as lists of Word
+    tuples read from the XHTML that pdftotext -bbox writes to a pipe.
+    """
+
+    result = subprocess.run(
+        pdftotext_bbox_args + list(option) + [str(pdf), '-'],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        check=True,
+        )
+    root = ElementTree.fromstring(result.stdout)
+    page = []
+    for element in root.iter():
+        tag = element.tag.rsplit('}', 1)[-1]
+        if tag == 'page':
+            page.append([])
+        elif tag == 'word' and page:
+            page[-1].append(Word(
+                float(element.get('xMin')),
+                float(element.get('yMin')),
+                float(element.get('xMax')),
+                float(element.get('yMax')),
+                element.text or '',
+                ))
+
+    return page
+
+
+def pdf_page_count(pdf):
+    """Return the number of pages in a PDF file, as reported by pdfinfo."""
+
+    result = subprocess.run(
+        pdfinfo_args + [str(pdf)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        check=True,
+        )
+    match = re.search(r'^Pages:\s+(\d+)', result.stdout.decode(coding, 'replace'), re.MULTILINE)
+
+    return int(match.group(1))
+
+
+def ocr_page(pdf, page, work, density='400x400', convert_option=(), tesseract_option=(),
+        config=(), image_suffix='.tiff'):
+    """Rasterize one page (numbered from 1) of a PDF into the work folder
+    and return the text tesseract reads from it.
+    """
+
+    image = Path(work) / Path('page-{}{}'.format(page, image_suffix))
+    subprocess.run(
+        convert_args + ['-density', density, '{}[{}]'.format(pdf, page - 1)]
+        + list(convert_option) + [str(image)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=True,
+        )
+    result = subprocess.run(
+        tesseract_args + list(tesseract_option) + [str(image), 'stdout'] + list(config),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        env=dict(environ, OMP_THREAD_LIMIT='1'),
+        check=True,
+        )
+    image.unlink()
+
+    return result.stdout.decode(coding, 'replace')
+
+
+def ocr_pages(pdf, page, processes=None, **kwargs):
+    """Return the text read by OCR from each listed page of a PDF.
+
+    Each page is rasterized and read by its own convert and tesseract
+    processes, up to processes (default: one per core) at once, and the
+    text is returned in page order. Keyword arguments go to ocr_page.
+    """
+
+    with TemporaryDirectory() as work:
+        with ThreadPoolExecutor(max_workers=processes or cpu_count()) as executor:
+            text = list(executor.map(
+                lambda this_page: ocr_page(pdf, this_page, work, **kwargs),
+                page,
+                ))
+
+    return text
+
+
+def ocr_to_lines(pdf, page=None, processes=None, **kwargs):
+    """Return the lines of text read by OCR from every page of a scanned
+    PDF, or from the listed pages.
+    """
+
+    if page is None:
+        page = range(1, pdf_page_count(pdf) + 1)
+
+    return text_to_lines(''.join(ocr_pages(pdf, page, processes, **kwargs)))
+
+
+def sheet_rows(path, sheet=0):
+    """Yield the rows of one sheet (by index) in an XLS or XLSX workbook,
+    as lists of typed cell values: str, int, float, bool or datetime, with
+    '' for an empty cell and int for a number without a fractional part.
+
+    XLSX files are streamed by openpyxl in read-only mode, so large
+    workbooks are never loaded whole; XLS files are read with xlrd.
+    """
+
+    path = Path(path)
+    if path.suffix.lower() == '.xls':
+        import xlrd
+
+        book = xlrd.open_workbook(str(path), on_demand=True)
+        try:
+            this_sheet = book.sheet_by_index(sheet)
+            for idx in range(this_sheet.nrows):
+                row = []
+                for cell in this_sheet.row(idx):
+                    if cell.ctype == xlrd.XL_CELL_DATE:
+                        value = xlrd.xldate_as_datetime(cell.value, book.datemode)
+                    elif cell.ctype == xlrd.XL_CELL_BOOLEAN:
+                        value = bool(cell.value)
+                    elif cell.ctype == xlrd.XL_CELL_ERROR:
+                        value = None
+                    else:
+                        value = cell.value
+                    row.append(cell_value(value))
+                yield row
+        finally:
+            book.release_resources()
+    else:
+        from openpyxl import load_workbook
+
+        book = load_workbook(str(path), read_only=True, data_only=True)
+        try:
+            for row in book.worksheets[sheet].iter_rows(values_only=True):
+                yield [cell_value(value) for value in row]
+        finally:
+            book.close()
+
+
+def cell_value(value):
+    """Return a spreadsheet value with empty cells as '' and whole numbers
+    stored as floats as int.
+    """
+
+    if value is None:
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+
+    return value
+
+
+def cell_text(value):
+    """Return the text of a cell from sheet_rows, e.g. '650' for 650.0."""
+
+    return str(cell_value(value))
+
 
 def is_number(string):
     string = re.sub(r'[^\w\s]', '', string)
@@ -172,14 +986,337 @@ def is_number(string):
     except ValueError:
         return False
 
+
+# Scanner for one numeric token in a sale: an optional dollar sign, a number
+# or range of numbers with thousands separators, and an optional unit
+number_token = re.compile(
+    r'(?P<dollar>\$)?\s*'
+    r'(?P<number>[0-9][0-9,]*(?:\.[0-9]*)?|\.[0-9]+)'
+    r'(?:\s*[-/]\s*\$?(?:[0-9][0-9,]*(?:\.[0-9]*)?|\.[0-9]+))?\s*'
+    r'(?:(?P<pound>\#|lbs?\.?)|/?\s*(?P<cwt>cwt|cw)\.?|/?\s*(?P<head>he?a?d?|pr|per(?:\s+he?a?d)?)\.?)?',
+    re.IGNORECASE,
+    )
+
+
+def is_number_token(string):
+    """Test whether a string is a number, like '$1,250.00', '850#',
+    '145.50/cwt', '1,300-1,400' or '12 hd'.
+    """
+
+    return bool(string) and number_token.fullmatch(string.strip()) is not None
+
+
+def number_tokens(word):
+    """Label the words of a sale line, returning for each word a pair of
+    the header key it fills (cattle_head, cattle_avg_weight,
+    cattle_price_cwt or cattle_price), or None for text, and its value
+    without $, commas or units.
+
+    A unit decides the label where present. Otherwise the first bare
+    integer is the head count and the next is the weight, and a number with
+    a dollar sign or decimals is a price per cwt if the line has a weight
+    and per head if not.
+    """
+
+    token = []
+    for this_word in word:
+        match = number_token.fullmatch(this_word.strip()) if this_word else None
+        if not match:
+            token.append([None, this_word])
+            continue
+        value = match.group('number').replace(',', '')
+        is_price = bool(match.group('dollar')) or '.' in value
+        if match.group('pound'):
+            key = 'cattle_avg_weight'
+        elif match.group('cwt'):
+            key = 'cattle_price_cwt'
+        elif match.group('head'):
+            key = 'cattle_price' if is_price else 'cattle_head'
+        else:
+            key = 'price' if is_price else 'integer'
+        token.append([key, value])
+
+    has_head = any(key == 'cattle_head' for key, value in token)
+    has_weight = any(key == 'cattle_avg_weight' for key, value in token)
+    for this_token in token:
+        if this_token[0] == 'integer':
+            if not has_head:
+                this_token[0], has_head = 'cattle_head', True
+            elif not has_weight:
+                this_token[0], has_weight = 'cattle_avg_weight', True
+            else:
+                this_token[0] = None
+    for this_token in token:
+        if this_token[0] == 'price':
+            this_token[0] = 'cattle_price_cwt' if has_weight else 'cattle_price'
+
+    return [tuple(this_token) for this_token in token]
+
+
+class PatternSet(object):
+    """A list of compiled patterns searched as one, giving the same result
+    as trying each pattern's search in turn until one matches.
+
+    The patterns are joined into one alternation, with named groups prefixed
+    by the branch, so a line costs one scan. The alternation finds the
+    leftmost match of any pattern; when that is not the first pattern, the
+    patterns before it are tried from just past that position. Hits are
+    counted per pattern. For patterns that never match the same line, pass
+    exclusive=True to skip that check and keep the most frequent pattern
+    first in the alternation. Pass engine=regex for patterns compiled by
+    the regex module.
+    """
+
+    flag_letter = ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's'), (re.VERBOSE, 'x'))
+    group_name = re.compile(r'\(\?P([<=])(\w+)')
+
+    def __init__(self, pattern, exclusive=False, engine=re):
+        self.pattern = list(pattern)
+        self.exclusive = exclusive
+        self.engine = engine
+        self.hits = [0] * len(self.pattern)
+        self.order = list(range(len(self.pattern)))
+        self.group = [
+            [(name, '_{}_{}'.format(idx, name)) for name in this_pattern.groupindex]
+            for idx, this_pattern in enumerate(self.pattern)
+            ]
+        self.compile()
+
+    def compile(self):
+        branch = []
+        for idx in self.order:
+            this_pattern = self.pattern[idx]
+            if re.search(r'\\[1-9]', this_pattern.pattern):
+                raise ValueError('numbered backreference in pattern {}'.format(idx))
+            flag = ''.join(letter for bit, letter in self.flag_letter if this_pattern.flags & bit)
+            source = self.group_name.sub(r'(?P\1_{}_\2'.format(idx), this_pattern.pattern)
+            if flag:
+                source = '(?{}:{})'.format(flag, source)
+            branch.append('(?P<_{}>{})'.format(idx, source))
+        self.combined = self.engine.compile('|'.join(branch))
+
+    def search(self, line):
+        """Return the index of the first pattern that matches the line and
+        the dictionary of its named groups, or None, None.
+        """
+
+        match = self.combined.search(line)
+        if not match:
+            return None, None
+        idx = int(match.lastgroup[1:])
+        group = {name: match.group(full_name) for name, full_name in self.group[idx]}
+
+        # A pattern earlier in the list may still match further along the line
+        if not self.exclusive:
+            for earlier in range(idx):
+                earlier_match = self.pattern[earlier].search(line, match.start() + 1)
+                if earlier_match:
+                    idx, group = earlier, earlier_match.groupdict()
+                    break
+
+        self.hits[idx] += 1
+        if self.exclusive and self.hits[idx] & (self.hits[idx] - 1) == 0:
+            order = sorted(self.order, key=lambda k: -self.hits[k])
+            if order != self.order:
+                self.order = order
+                self.compile()
+
+        return idx, group
+
+
+def file_digest(path):
+    """Return the md5 digest of a file, read in chunks."""
+
+    hash = hashlib.md5()
+    with Path(path).open('rb') as io:
+        for chunk in iter(lambda: io.read(64 * 1024), b''):
+            hash.update(chunk)
+
+    return hash.hexdigest()
+
+
+def archive_digest(path):
+    """Return the md5 digest in the name of a raw report archived by
+    ReportRaw.clean, <prefix>_<md5>.<suffix>, or None for any other name.
+    """
+
+    digest = Path(path).stem.rsplit('_', 1)[-1]
+    if re.fullmatch(r'[0-9a-f]{32}', digest):
+        return digest
+
+    return None
+
+
+class TextCache(object):
+    """Text extracted from raw reports, kept in <prefix>_scrape/text/ and
+    keyed by the md5 of the raw file plus the extractor command line, so
+    re-parsing an archived report skips the extraction.
+    """
+
+    def __init__(self, argv, prefix):
+        self.prefix = prefix
+        self.folder = script_folder(argv) / Path(self.prefix + '_scrape/text')
+
+    def path(self, digest, command):
+        command_hash = hashlib.md5(' '.join(command).encode()).hexdigest()
+        return self.folder / Path('{}_{}_{}.json'.format(self.prefix, digest, command_hash[:12]))
+
+    def get(self, digest, command):
+        """Return the cached lines, or None when not cached."""
+
+        path = self.path(digest, command)
+        if not path.exists():
+            return None
+        with path.open('r', encoding=coding) as io:
+            return json.load(io)
+
+    def put(self, digest, command, line):
+        path = self.path(digest, command)
+        self.folder.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix('.{}.tmp'.format(getpid()))
+        with temp_path.open('w', encoding=coding) as io:
+            json.dump(line, io)
+        temp_path.replace(path)
+
+    def pdf_to_lines(self, pdf, *option, digest=None, errors='strict', **kwargs):
+        """Return the lines pdf_to_lines extracts from a PDF file,
+        running pdftotext (and OCR) only on a cache miss.
+        """
+
+        if not digest:
+            digest = file_digest(pdf)
+        command = pdftotext_args + list(option) + ['errors=' + errors]
+        if kwargs.get('ocr'):
+            command += convert_args + tesseract_args + [
+                '{}={!r}'.format(k, v) for k, v in sorted(kwargs.items()) if k != 'processes'
+                ]
+        line = self.get(digest, command)
+        if line is None:
+            line = pdf_to_lines(pdf, *option, errors=errors, **kwargs)
+            self.put(digest, command, line)
+
+        return line
+
+    def pdf_pages(self, pdf, *option, digest=None, errors='strict'):
+        """Yield the lines of each page of a PDF file, from the cache when
+        the whole report was extracted before and lazily otherwise. A miss
+        read through to the last page fills the cache.
+        """
+
+        if not digest:
+            digest = file_digest(pdf)
+        command = pdftotext_args + list(option) + ['errors=' + errors, 'pages']
+        page = self.get(digest, command)
+        if page is not None:
+            yield from page
+            return
+
+        page = []
+        for line in pdf_pages(pdf, *option, errors=errors):
+            page.append(list(line))
+            yield line
+        self.put(digest, command, page)
+
+    def pdf_to_words(self, pdf, *option, digest=None):
+        """Return the words pdf_to_words finds on each page of a PDF file,
+        running pdftotext only on a cache miss.
+        """
+
+        if not digest:
+            digest = file_digest(pdf)
+        command = pdftotext_bbox_args + list(option)
+        page = self.get(digest, command)
+        if page is None:
+            page = pdf_to_words(pdf, *option)
+            self.put(digest, command, page)
+
+        return [[Word(*this_word) for this_word in word] for word in page]
+
+    def ocr_to_lines(self, pdf, digest=None, **kwargs):
+        """Return the lines ocr_to_lines reads from a scanned PDF file,
+        running OCR only on a cache miss.
+        """
+
+        if not digest:
+            digest = file_digest(pdf)
+        command = convert_args + tesseract_args + [
+            '{}={!r}'.format(k, v) for k, v in sorted(kwargs.items()) if k != 'processes'
+            ]
+        line = self.get(digest, command)
+        if line is None:
+            line = ocr_to_lines(pdf, **kwargs)
+            self.put(digest, command, line)
+
+        return line
+
+
+class ListingCache(object):
+    """Validators for the listing pages of a market, kept in
+    <prefix>_scrape/listing.json, so unchanged pages are skipped.
+    """
+
+    def __init__(self, argv, prefix):
+        self.path = script_folder(argv) / Path(prefix + '_scrape/listing.json')
+        if self.path.exists():
+            with self.path.open('r', encoding=coding) as io:
+                self.validator = json.load(io)
+        else:
+            self.validator = {}
+        self.pending = {}
+
+    def get(self, url, **kwargs):
+        """GET a listing page, returning None if it is unchanged since
+        the last call to save(), either by a 304 response or an identical body.
+        """
+
+        cached = self.validator.get(url, {})
+        headers = dict(kwargs.pop('headers', {}))
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+        response = http_get(url, headers=headers, **kwargs)
+        if response.status_code == 304:
+            return None
+        response.raise_for_status()
+
+        digest = hashlib.md5(response.content).hexdigest()
+        if digest == cached.get('digest'):
+            return None
+        self.pending[url] = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'digest': digest,
+            }
+
+        return response
+
+    def save(self):
+        """Record the pages fetched by get(), once every report they list
+        has been handled, so a failed run fetches them again.
+        """
+
+        if not self.pending:
+            return
+        self.validator.update(self.pending)
+        self.pending.clear()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix('.{}.tmp'.format(getpid()))
+        with temp_path.open('w', encoding=coding) as io:
+            json.dump(self.validator, io, indent=1)
+        temp_path.replace(self.path)
+
+
 class ArchiveFolder(object):
 
     def __init__(self, argv, prefix):
         self.prefix = prefix
-        self.archive = Path(argv[0]).parent / Path(self.prefix + '_scrape/dbased/')
+        self.archive = script_folder(argv) / Path(self.prefix + '_scrape/dbased/')
         if not self.archive.exists():
             self.archive.mkdir(parents=True)
-        
+        self.index = self.archive.parent / Path('index.json')
+        self.report = None
+
     def new_csv(self, sale_date, title=None):
 
         if not sale_date:
@@ -199,43 +1336,428 @@ class ArchiveFolder(object):
 
         return io_name
 
+    def read_index(self):
+        """Return the index of raw reports, mapping each url to the digest
+        of its raw file, its sale date, title and time fetched.
+        """
+
+        if self.report is None:
+            if self.index.exists():
+                with self.index.open('r', encoding=coding) as io:
+                    self.report = json.load(io)
+            else:
+                self.report = {}
+
+        return self.report
+
+    def record(self, url, digest, sale_date, title=None):
+        """Add a raw report to the index, once its sale date is known."""
+
+        report = self.read_index()
+        report[url] = {
+            'digest': digest,
+            'sale_date': sale_date.strftime('%Y-%m-%d') if sale_date else None,
+            'title': title,
+            'fetched_at': datetime.now().isoformat(timespec='seconds'),
+            }
+
+        # Replace the index whole, so a crash mid-write leaves the old one
+        temp_index = self.index.with_suffix('.{}.tmp'.format(getpid()))
+        with temp_index.open('w', encoding=coding) as io:
+            json.dump(report, io, indent=1)
+        temp_index.replace(self.index)
+
+    def is_archived(self, url=None, digest=None):
+        """Determine whether a report, identified by its url before download
+        or by the digest of its raw file before conversion, was indexed
+        and its CSV file is already in the archive.
+        """
+
+        report = self.read_index()
+        entry = []
+        if url in report:
+            entry.append(report[url])
+        if digest:
+            entry.extend(v for v in report.values() if v['digest'] == digest)
+        for this_entry in entry:
+            if not this_entry['sale_date']:
+                continue
+            sale_date = datetime.strptime(this_entry['sale_date'], '%Y-%m-%d').date()
+            if not self.new_csv(sale_date, this_entry['title']):
+                return True
+
+        return False
+
 class ReportRaw(object):
+    """A raw report downloaded to a temp file, with files derived from it
+    sharing its stem. Each report gets its own working directory under
+    <prefix>_scrape/, so reports of one market can be converted concurrently.
+    """
 
     def __init__(self, argv, prefix, suffix='pdf'):
-        path = Path(argv[0])
+        path = script_folder(argv)
         self.prefix = prefix
         self.suffix = '.' + suffix
-        self.folder = path.parents[0] / Path(self.prefix + '_scrape/' + suffix)
-        self.raw = path.parents[0] / Path(self.prefix + '_scrape/') / Path('temp.' + suffix)
-        self.dirty = []
+        self.folder = path / Path(self.prefix + '_scrape/' + suffix)
+        self.work = None
+        self.remove_work = None
+        self.hexdigest = None
+        self.text = TextCache(argv, prefix)
         if not self.folder.exists():
             self.folder.mkdir(parents=True)
 
     def __str__(self):
         return str(self.raw)
 
+    @property
+    def raw(self):
+        """Path to the temp file of the current report."""
+
+        if not self.work:
+            self.work = Path(mkdtemp(prefix='temp_', dir=str(self.folder.parent)))
+            self.remove_work = finalize(self, rmtree, str(self.work), ignore_errors=True)
+        return self.work / Path('temp' + self.suffix)
+
+    def fetch(self, url, chunk_size=64 * 1024, **kwargs):
+        """Stream a report from a url into the temp file in chunks,
+        computing its digest on the way, and return the response.
+        """
+
+        hash = hashlib.md5()
+        with http_get(url, stream=True, **kwargs) as response:
+            response.raise_for_status()
+            with self.raw.open('wb') as io:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    hash.update(chunk)
+                    io.write(chunk)
+        self.hexdigest = hash.hexdigest()
+
+        return response
+
+    def digest(self):
+        """Return the md5 digest of the downloaded temp file."""
+
+        if not self.hexdigest:
+            self.hexdigest = file_digest(self.raw)
+
+        return self.hexdigest
+
+    def pdf_to_lines(self, *option, errors='strict', **kwargs):
+        """Return the lines of text in the temp PDF, from the text cache
+        when this report was extracted before.
+        """
+
+        return self.text.pdf_to_lines(self.raw, *option, digest=self.digest(), errors=errors, **kwargs)
+
+    def pdf_pages(self, *option, errors='strict'):
+        """Yield the lines of each page of the temp PDF, extracting lazily."""
+
+        return self.text.pdf_pages(self.raw, *option, digest=self.digest(), errors=errors)
+
+    def pdf_to_words(self, *option):
+        """Return the words on each page of the temp PDF, with their
+        bounding boxes, for scrape_layout.table.
+        """
+
+        return self.text.pdf_to_words(self.raw, *option, digest=self.digest())
+
+    def ocr_to_lines(self, **kwargs):
+        """Return the lines read by OCR from the temp PDF, page by page in
+        parallel, from the text cache when this report was read before.
+        """
+
+        return self.text.ocr_to_lines(self.raw, digest=self.digest(), **kwargs)
+
     def clean(self, dirty=False):
         # Move downloaded temp file into the folder for archives
-        with self.raw.open('rb') as io:
-            hash = hashlib.md5(io.read())
-        digest = hash.hexdigest()
+        digest = self.digest()
         archive_name = self.prefix + '_' + digest + self.suffix
         archive = self.folder / Path(archive_name)
         try:
             self.raw.rename(archive)
         except FileExistsError:
             self.raw.unlink()
+        self.hexdigest = None
 
-        # Remove temp files
-        if not dirty:
-            for item in list(self.dirty):
-                item.unlink()
-                self.dirty.remove(item)
+        # Remove temp files, unless kept for inspection (scrape.sh leaves
+        # temp_* folders out of the archive), and start the next report in
+        # a new working directory
+        if dirty:
+            self.remove_work.detach()
+        else:
+            self.remove_work()
+        self.work = None
+
+        return digest
 
     def with_suffix(self, *args, **kwargs):
-        new = self.raw.with_suffix(*args, **kwargs)
-        self.dirty.append(new)
-        return new
+        return self.raw.with_suffix(*args, **kwargs)
+
+    def open(self, mode='r', *args, **kwargs):
+        if set(mode) & set('wax+'):
+            self.hexdigest = None
+        return self.raw.open(mode, *args, **kwargs)
+
+
+# Column of the CSV header for each short group name used in the sale
+# patterns of a MarketSpec; full column names may be used as well
+sale_field = {
+    'name': 'consignor_name',
+    'city': 'consignor_city',
+    'state': 'consignor_state',
+    'cattle': 'cattle_cattle',
+    'head': 'cattle_head',
+    'weight': 'cattle_avg_weight',
+    'price_cwt': 'cattle_price_cwt',
+    'price_head': 'cattle_price',
+    }
+
+
+class MarketSpec(object):
+    """Declarative description of a market report scraper, run by run_spec.
+
+    The report links of the listing at report_path are read by fetch_links
+    from the element matching container_selector, keeping those that
+    link_filter (a pattern searched in the href, or a function of the text
+    and href) accepts. The sale date is read from the link 'text', its
+    'href', the 'report' lines themselves, or by a function of the text and
+    href. Each report is a 'pdf', 'html', 'txt', 'xls'
+    or 'xlsx' document, read into lines, and each line that passes
+    line_filter (a pattern or a function of the line) and matches one of
+    sale_pattern is a sale. A 'price' group is per head when price_type
+    (a group holding the unit) matches head_price, else per cwt; where
+    price_type is missing or empty, the price_rule 'cwt', 'head' or
+    'weight' (cwt when the line has a weight) decides.
+
+    Scripts migrate by replacing main() with run_spec(spec, argv), keeping
+    any helper that does not fit by overriding the method it replaces.
+    """
+
+    def __init__(
+            self, report_path, sale_pattern, container_selector=None, link_filter=None, date_source='text',
+            document='pdf', pdf_option=(), ocr_option=None, line_filter=None, not_cattle=None,
+            head_pattern=None, head_price=re.compile(r'he?a?d', re.IGNORECASE), price_rule='cwt',
+            stop_at_archived=False,
+            ):
+        self.report_path = report_path
+        self.sale_pattern = PatternSet(sale_pattern)
+        self.container_selector = container_selector
+        self.link_filter = link_filter
+        self.date_source = date_source
+        self.document = document
+        self.pdf_option = pdf_option
+        self.ocr_option = ocr_option
+        self.line_filter = line_filter
+        self.not_cattle = not_cattle
+        self.head_pattern = head_pattern
+        self.head_price = head_price
+        self.price_rule = price_rule
+        self.stop_at_archived = stop_at_archived
+
+    def links(self, link):
+        """Return the (text, href) of the report links of a listing page."""
+
+        if self.link_filter is None:
+            return link
+        if callable(self.link_filter):
+            return [(text, href) for text, href in link if self.link_filter(text, href)]
+
+        return [(text, href) for text, href in link if self.link_filter.search(href)]
+
+    def sale_date(self, text, href):
+        """Return the sale date of a report from its link."""
+
+        if callable(self.date_source):
+            return self.date_source(text, href)
+        if self.date_source == 'href':
+            return parse_sale_date(href.rsplit('/', 1)[-1])
+
+        return parse_sale_date(text)
+
+    def report_date(self, line):
+        """Return the sale date from the first report line holding a date
+        in one of the common formats of date_format.
+        """
+
+        for this_line in line:
+            if any(pattern.search(this_line) for pattern, part in date_format):
+                try:
+                    return parse_sale_date(this_line)
+                except (ValueError, OverflowError):
+                    continue
+
+        return None
+
+    def read_report(self, temp_raw):
+        """Return the stripped, non-empty lines of a downloaded report.
+        Table rows are joined into lines with two spaces between cells,
+        matching the layout pdftotext gives columns.
+        """
+
+        if self.document == 'pdf':
+            if self.ocr_option is None:
+                line = temp_raw.pdf_to_lines(*self.pdf_option)
+            else:
+                line = temp_raw.pdf_to_lines(*self.pdf_option, ocr=True, **self.ocr_option)
+        elif self.document in ('xls', 'xlsx'):
+            line = ['  '.join(cell_text(value) for value in row) for row in sheet_rows(temp_raw.raw)]
+        elif self.document == 'html':
+            html = temp_raw.raw.read_bytes()
+            line = ['  '.join(row) for row in html_table_rows(html, None)]
+            if not line:
+                from bs4 import BeautifulSoup
+                line = text_to_lines(BeautifulSoup(html, 'lxml').get_text())
+        else:
+            with temp_raw.open('r', encoding=coding, errors='replace') as io:
+                line = text_to_lines(io.read())
+
+        return [this_line.strip() for this_line in line if this_line.strip()]
+
+    def sale_head(self, line):
+        """Return the total number of head sold, from the first line
+        matching head_pattern.
+        """
+
+        if self.head_pattern is None:
+            return None
+        for this_line in line:
+            match = self.head_pattern.search(this_line)
+            if match:
+                return match.group(1).replace(',', '')
+
+        return None
+
+    def clean(self, column, value):
+        """Return the CSV value of a matched field."""
+
+        value = value.strip()
+        if column in ('cattle_head', 'cattle_avg_weight', 'cattle_price_cwt', 'cattle_price'):
+            value = value.replace(',', '').replace('$', '')
+
+        return value
+
+    def get_sale(self, line):
+        """Return the columns of the sale on a line, or {} if it is not one."""
+
+        if self.line_filter is not None:
+            if callable(self.line_filter):
+                is_sale = self.line_filter(line)
+            else:
+                is_sale = self.line_filter.search(line)
+            if not is_sale:
+                return {}
+        idx, match = self.sale_pattern.search(line)
+        if idx is None:
+            return {}
+        if self.not_cattle is not None and self.not_cattle.search(match.get('cattle') or ''):
+            return {}
+
+        sale = {}
+        for name, value in match.items():
+            column = sale_field.get(name, name)
+            if column in header and value:
+                sale[column] = self.clean(column, value)
+        if match.get('price'):
+            price_type = match.get('price_type')
+            if price_type:
+                is_head = bool(self.head_price.search(price_type))
+            elif self.price_rule == 'weight':
+                is_head = not sale.get('cattle_avg_weight')
+            else:
+                is_head = self.price_rule == 'head'
+            column = 'cattle_price' if is_head else 'cattle_price_cwt'
+            sale[column] = self.clean(column, match['price'])
+
+        return {k: v for k, v in sale.items() if v}
+
+    def write_sale(self, line, this_default_sale, writer):
+        """Extract sales from a list of report lines and write them to a CSV file."""
+
+        for this_line in line:
+            sale = self.get_sale(this_line)
+            if sale:
+                this_sale = this_default_sale.copy()
+                this_sale.update(sale)
+                writer.writerow(this_sale)
+
+
+def run_spec(spec, argv):
+    """Scrape the reports of the market running argv with a MarketSpec,
+    writing a CSV file for each report not in the archive.
+    """
+
+    # The market is a dict, or a list of them for a website with several
+    default_sale, base_url, prefix = get_market(argv)
+    if isinstance(default_sale, list):
+        default_sale = default_sale[0]
+    temp_raw = ReportRaw(argv, prefix, spec.document)
+
+    # Collect individual reports into a list, unless unchanged since last run
+    listing = ListingCache(argv, prefix)
+    report = fetch_links(base_url + spec.report_path, spec.container_selector, listing=listing)
+    if report is None:
+        return
+    report = spec.links(report)
+
+    # Locate existing CSV files
+    archive = ArchiveFolder(argv, prefix)
+
+    # Write a CSV file for each report not in the archive, saving the listing
+    # only if every report had a usable date, so one posted ahead of its
+    # sale (or with a date not yet understood) is found again next run
+    is_complete = True
+    for text, href in report:
+        report_url = urljoin(base_url, href)
+
+        if spec.date_source == 'report':
+            if archive.is_archived(url=report_url):
+                if spec.stop_at_archived:
+                    break
+                continue
+        else:
+            try:
+                sale_date = spec.sale_date(text, href)
+            except (ValueError, OverflowError):
+                sale_date = None
+            if not sale_date:
+                is_complete = False
+                continue
+            io_name = archive.new_csv(sale_date)
+
+            # Stop iteration if this report is already archived
+            if not io_name:
+                if spec.stop_at_archived:
+                    break
+                continue
+
+        # Read the report into lines, from the text cache when converted before
+        temp_raw.fetch(report_url)
+        line = spec.read_report(temp_raw)
+        digest = temp_raw.clean()
+
+        if spec.date_source == 'report':
+            sale_date = spec.report_date(line)
+            if not sale_date:
+                is_complete = False
+            io_name = archive.new_csv(sale_date)
+        archive.record(report_url, digest, sale_date)
+        if not io_name or not line:
+            continue
+
+        # Initialize the default sale dictionary
+        this_default_sale = default_sale.copy()
+        this_default_sale.update({
+            'sale_year': sale_date.year,
+            'sale_month': sale_date.month,
+            'sale_day': sale_date.day,
+            'sale_head': spec.sale_head(line),
+            })
+
+        # Open a new CSV file and write each sale
+        with io_name.open('w', encoding=coding) as io:
+            writer = csv.DictWriter(io, header, lineterminator='\n')
+            writer.writeheader()
+            spec.write_sale(line, this_default_sale, writer)
 
-    def open(self, *args, **kwargs):
-        return self.raw.open(*args, **kwargs)
+    if is_complete:
+        listing.save()